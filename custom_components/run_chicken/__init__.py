@@ -11,15 +11,22 @@ import logging
 from typing import TYPE_CHECKING
 
 from bleak import BleakClient
+from bleak.backends.device import BLEDevice
 from bleak_retry_connector import establish_connection
 from homeassistant.components.bluetooth import async_ble_device_from_address
 from homeassistant.const import Platform
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.util.hass_dict import HassKey
 
-from .const import CONF_RECORD_RAW_BYTES
+from .const import CONF_IDLE_TIMEOUT, CONF_RECORD_FORMAT, CONF_RECORD_RAW_BYTES, CONF_TRACE_PHASES, DOMAIN
 from .coordinator import RunChickenCoordinator
+from .fleet import FLEET_KEY, RunChickenFleetScheduler
 from .recorder import RawByteRecorder
 from .run_chicken_ble.device import RunChickenDevice
+from .run_chicken_ble.protocol import RunChickenProtocol
+from .run_chicken_ble.recording import RecordFormat
+from .run_chicken_ble.trace import RunChickenTracer
+from .storage import RunChickenStore
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -29,10 +36,15 @@ if TYPE_CHECKING:
 
 PLATFORMS: list[Platform] = [
     Platform.COVER,
+    Platform.SENSOR,
 ]
 
 type RunChickenConfigEntry = ConfigEntry[RunChickenCoordinator]
 
+#: Phase tracer shared by every door that has tracing enabled, so one export
+#: shows them all on a single timeline.
+TRACER_KEY: HassKey[RunChickenTracer] = HassKey(f"{DOMAIN}_tracer")
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: RunChickenConfigEntry) -> bool:
     """Set up a Run-Chicken door from a config entry."""
@@ -41,20 +53,45 @@ async def async_setup_entry(hass: HomeAssistant, entry: RunChickenConfigEntry) -
         msg = "No address found for Run-Chicken device."
         raise ConfigEntryNotReady(msg)
 
+    store = RunChickenStore(hass, address)
+    await store.async_load()
+
     ble_device = async_ble_device_from_address(hass, address, connectable=True)
     if ble_device is None:
-        msg = f"BLE device with address {address} not found."
-        raise ConfigEntryNotReady(msg)
+        # A door we've seen before can start from its stored name and state; the
+        # placeholder is never connected to: the coordinator waits for the next
+        # advertisement, which brings the real BLEDevice.
+        if store.data is None:
+            msg = f"BLE device with address {address} not found."
+            raise ConfigEntryNotReady(msg)
+        _LOGGER.debug("Run-Chicken %s not advertising yet; starting from stored state", address)
+        ble_device = BLEDevice(address, store.name, None)
 
     _LOGGER.debug("Setting up Run-Chicken device %s", address)
     device = RunChickenDevice(ble_device)
+    # Reuse what earlier connections learned: the detected model (the placeholder
+    # above may have no name to detect it from) and the characteristic handles.
+    if store.model is not None and (protocol := RunChickenProtocol.for_model(store.model)) is not None:
+        device.protocol = protocol
+    device.gatt_handles = store.gatt_handles
+    device.gatt_cache_callback = lambda handles: store.async_save_gatt(device.model, handles)
+    # Lease mode frees the proxy's connection slot between polls and commands.
+    device.idle_timeout = entry.options.get(CONF_IDLE_TIMEOUT) or None
     if entry.options.get(CONF_RECORD_RAW_BYTES):
+        record_format = RecordFormat(entry.options.get(CONF_RECORD_FORMAT, RecordFormat.TEXT))
+        extension = "bin" if record_format is RecordFormat.BINARY else "log"
         # Sanitise the address for a filesystem- and editor-friendly name.
-        recording_path = hass.config.path(f"run_chicken_{address.replace(':', '').lower()}.log")
-        device.raw_recorder = RawByteRecorder(hass, recording_path).record
+        recording_path = hass.config.path(f"run_chicken_{address.replace(':', '').lower()}.{extension}")
+        recorder = RawByteRecorder(hass, recording_path, record_format=record_format)
+        recorder.async_start()
+        entry.async_on_unload(recorder.async_stop)
+        device.raw_recorder = recorder.record
         _LOGGER.info("Run-Chicken raw-byte recording enabled, writing to %s", recording_path)
+    if entry.options.get(CONF_TRACE_PHASES):
+        device.tracer = hass.data.setdefault(TRACER_KEY, RunChickenTracer())
 
-    door_coordinator = RunChickenCoordinator(hass, entry, device)
+    fleet = hass.data.setdefault(FLEET_KEY, RunChickenFleetScheduler())
+    door_coordinator = RunChickenCoordinator(hass, entry, device, fleet, store)
     await door_coordinator.async_init()
     entry.runtime_data = door_coordinator
 
@@ -76,6 +113,7 @@ async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     if address is None:
         msg = "No address found for Run-Chicken device during removal."
         raise ValueError(msg)
+    await RunChickenStore(hass, address).async_remove()
     ble_device = async_ble_device_from_address(hass, address)
     if ble_device is None:
         _LOGGER.debug("Run-Chicken device %s not available; nothing to disconnect", address)
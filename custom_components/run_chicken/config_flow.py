@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import TYPE_CHECKING, Any
 
@@ -12,15 +13,30 @@ from homeassistant.components.bluetooth import (
     async_discovered_service_info,
 )
 from homeassistant.config_entries import (
+    SOURCE_INTEGRATION_DISCOVERY,
     ConfigFlow,
     ConfigFlowResult,
     OptionsFlowWithReload,
 )
 from homeassistant.const import CONF_ADDRESS
 from homeassistant.core import callback
+from homeassistant.data_entry_flow import FlowResultType
+from homeassistant.helpers import config_validation as cv
 
-from .const import CONF_RECORD_RAW_BYTES, DOMAIN, MANUFACTURER_ID
+from .const import (
+    BATCH_PROBE_CONCURRENCY,
+    CONF_IDLE_TIMEOUT,
+    CONF_NOTIFY_COALESCE,
+    CONF_RECORD_FORMAT,
+    CONF_RECORD_RAW_BYTES,
+    CONF_REFRESH_DEBOUNCE,
+    CONF_TRACE_PHASES,
+    DOMAIN,
+    EVENT_DEBOUNCE_TIME,
+    MANUFACTURER_ID,
+)
 from .run_chicken_ble import RunChickenDevice
+from .run_chicken_ble.recording import RecordFormat
 
 if TYPE_CHECKING:
     from homeassistant.components.bluetooth import BluetoothServiceInfoBleak
@@ -28,6 +44,8 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+CONF_ADDRESSES = "addresses"
+
 
 class RunChickenConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Run-Chicken."""
@@ -40,6 +58,12 @@ class RunChickenConfigFlow(ConfigFlow, domain=DOMAIN):
         """Initialize the config flow."""
         # Maps a device address to a human-readable label for the picker.
         self._discovered_devices: dict[str, str] = {}
+        # Signal strength of each discovered door, for ranking the batch step.
+        self._discovered_rssi: dict[str, int] = {}
+        # Batch onboarding: the probe of every discovered door, and its outcome
+        # (address -> error key, or None if the door answered).
+        self._probe_task: asyncio.Task[dict[str, str | None]] | None = None
+        self._probe_results: dict[str, str | None] = {}
 
     @staticmethod
     @callback
@@ -77,21 +101,12 @@ class RunChickenConfigFlow(ConfigFlow, domain=DOMAIN):
             errors=errors,
         )
 
-    async def async_step_user(self, user_input: dict[str, Any] | None = None) -> ConfigFlowResult:
-        """Show a list of discovered devices and let the user pick one."""
-        errors: dict[str, str] = {}
-        if user_input is not None:
-            address = user_input[CONF_ADDRESS]
-            await self.async_set_unique_id(address, raise_on_progress=False)
-            self._abort_if_unique_id_configured()
-            error = await self._async_try_connect(address)
-            if error is None:
-                return self.async_create_entry(title=self._discovered_devices[address], data={})
-            errors["base"] = error
-
+    async def async_step_user(self, user_input: dict[str, Any] | None = None) -> ConfigFlowResult:  # noqa: ARG002
+        """Find unconfigured doors; offer to add them all at once when there is more than one."""
         # Skip devices that are already configured.
         current_addresses = self._async_current_ids()
         self._discovered_devices = {}
+        self._discovered_rssi = {}
         for info in async_discovered_service_info(self.hass):
             address = info.address
             if address in current_addresses or address in self._discovered_devices:
@@ -99,12 +114,134 @@ class RunChickenConfigFlow(ConfigFlow, domain=DOMAIN):
             if MANUFACTURER_ID not in info.manufacturer_data:
                 continue
             self._discovered_devices[address] = f"{info.name} ({address})" if info.name else address
+            self._discovered_rssi[address] = info.rssi
 
         if not self._discovered_devices:
             return self.async_abort(reason="no_devices_found")
+        if len(self._discovered_devices) == 1:
+            return await self.async_step_pick_device()
+        return self.async_show_menu(
+            step_id="user",
+            menu_options=["batch", "pick_device"],
+            description_placeholders={"count": str(len(self._discovered_devices))},
+        )
+
+    async def async_step_pick_device(self, user_input: dict[str, Any] | None = None) -> ConfigFlowResult:
+        """Show a list of discovered devices and let the user pick one."""
+        errors: dict[str, str] = {}
+        if user_input is not None:
+            address = user_input[CONF_ADDRESS]
+            await self.async_set_unique_id(address, raise_on_progress=False)
+            self._abort_if_unique_id_configured()
+            error = await self._async_try_connect(address)
+            if error is None:
+                return self.async_create_entry(title=self._discovered_devices[address], data={})
+            errors["base"] = error
 
         schema = vol.Schema({vol.Required(CONF_ADDRESS): vol.In(self._discovered_devices)})
-        return self.async_show_form(step_id="user", data_schema=schema, errors=errors)
+        return self.async_show_form(step_id="pick_device", data_schema=schema, errors=errors)
+
+    async def async_step_batch(self, user_input: dict[str, Any] | None = None) -> ConfigFlowResult:  # noqa: ARG002
+        """Probe every discovered door concurrently, showing progress while it runs."""
+        if self._probe_task is None:
+            self._probe_task = self.hass.async_create_task(self._async_probe_all(), f"{DOMAIN}_batch_probe")
+        if not self._probe_task.done():
+            return self.async_show_progress(
+                step_id="batch",
+                progress_action="probe",
+                progress_task=self._probe_task,
+                description_placeholders={"count": str(len(self._discovered_devices))},
+            )
+        self._probe_results = self._probe_task.result()
+        return self.async_show_progress_done(next_step_id="batch_select")
+
+    async def async_step_batch_select(self, user_input: dict[str, Any] | None = None) -> ConfigFlowResult:
+        """Let the user pick which probed doors to add, best candidates first, and add them together."""
+        errors: dict[str, str] = {}
+        if user_input is not None:
+            if addresses := user_input[CONF_ADDRESSES]:
+                return await self._async_create_entries(addresses)
+            errors["base"] = "no_doors_selected"
+
+        # Reachable doors first, then by signal strength; unreachable ones are
+        # listed but not selected.
+        ranked = sorted(
+            self._probe_results,
+            key=lambda address: (self._probe_results[address] is not None, -self._discovered_rssi[address]),
+        )
+        options = {address: self._batch_label(address) for address in ranked}
+        reachable = [address for address in ranked if self._probe_results[address] is None]
+        schema = vol.Schema({vol.Required(CONF_ADDRESSES, default=reachable): cv.multi_select(options)})
+        return self.async_show_form(
+            step_id="batch_select",
+            data_schema=schema,
+            errors=errors,
+            description_placeholders={"reachable": str(len(reachable)), "count": str(len(ranked))},
+        )
+
+    async def async_step_integration_discovery(self, discovery_info: dict[str, Any]) -> ConfigFlowResult:
+        """Create the entry for a door selected, and already probed, in a batch onboarding step."""
+        address = discovery_info[CONF_ADDRESS]
+        # The door's own bluetooth discovery flow is usually still in progress;
+        # creating the entry aborts it.
+        await self.async_set_unique_id(address, raise_on_progress=False)
+        self._abort_if_unique_id_configured()
+        return self.async_create_entry(title=discovery_info["title"], data={})
+
+    async def _async_probe_all(self) -> dict[str, str | None]:
+        """Probe every discovered door, at most ``BATCH_PROBE_CONCURRENCY`` at a time."""
+        semaphore = asyncio.Semaphore(BATCH_PROBE_CONCURRENCY)
+
+        async def probe(address: str) -> str | None:
+            async with semaphore:
+                return await self._async_try_connect(address)
+
+        addresses = list(self._discovered_devices)
+        errors = await asyncio.gather(*(probe(address) for address in addresses))
+        return dict(zip(addresses, errors, strict=True))
+
+    async def _async_create_entries(self, addresses: list[str]) -> ConfigFlowResult:
+        """Create an entry per selected address, this flow's own for the first; report any not added."""
+        # A door may have been set up (say, from its own discovery) since the
+        # list was shown; skip it rather than aborting the whole batch.
+        current_addresses = self._async_current_ids()
+        not_added = [self._discovered_devices[address] for address in addresses if address in current_addresses]
+        addresses = [address for address in addresses if address not in current_addresses]
+        if not addresses:
+            return self.async_abort(reason="already_configured")
+        first, *others = addresses
+        await self.async_set_unique_id(first, raise_on_progress=False)
+        self._abort_if_unique_id_configured()
+
+        results = await asyncio.gather(
+            *(
+                self.hass.config_entries.flow.async_init(
+                    DOMAIN,
+                    context={"source": SOURCE_INTEGRATION_DISCOVERY},
+                    data={CONF_ADDRESS: address, "title": self._discovered_devices[address]},
+                )
+                for address in others
+            ),
+            return_exceptions=True,
+        )
+        for address, result in zip(others, results, strict=True):
+            if isinstance(result, BaseException) or result["type"] is not FlowResultType.CREATE_ENTRY:
+                _LOGGER.warning("Could not add Run-Chicken door %s in batch setup: %s", address, result)
+                not_added.append(self._discovered_devices[address])
+
+        if not_added:
+            return self.async_create_entry(
+                title=self._discovered_devices[first],
+                data={},
+                description="batch_partial",
+                description_placeholders={"not_added": ", ".join(not_added)},
+            )
+        return self.async_create_entry(title=self._discovered_devices[first], data={})
+
+    def _batch_label(self, address: str) -> str:
+        """Return the picker label for a probed door, with its signal strength and reachability."""
+        label = f"{self._discovered_devices[address]}, {self._discovered_rssi[address]} dBm"
+        return label if self._probe_results[address] is None else f"{label}, not reachable"
 
     async def _async_try_connect(self, address: str) -> str | None:
         """
@@ -152,6 +289,26 @@ class RunChickenOptionsFlow(OptionsFlowWithReload):
                     CONF_RECORD_RAW_BYTES,
                     default=self.config_entry.options.get(CONF_RECORD_RAW_BYTES, False),
                 ): bool,
+                vol.Required(
+                    CONF_RECORD_FORMAT,
+                    default=self.config_entry.options.get(CONF_RECORD_FORMAT, RecordFormat.TEXT),
+                ): vol.In([record_format.value for record_format in RecordFormat]),
+                vol.Required(
+                    CONF_REFRESH_DEBOUNCE,
+                    default=self.config_entry.options.get(CONF_REFRESH_DEBOUNCE, EVENT_DEBOUNCE_TIME),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=300)),
+                vol.Required(
+                    CONF_NOTIFY_COALESCE,
+                    default=self.config_entry.options.get(CONF_NOTIFY_COALESCE, 0),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=10)),
+                vol.Required(
+                    CONF_IDLE_TIMEOUT,
+                    default=self.config_entry.options.get(CONF_IDLE_TIMEOUT, 0),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=3600)),
+                vol.Required(
+                    CONF_TRACE_PHASES,
+                    default=self.config_entry.options.get(CONF_TRACE_PHASES, False),
+                ): bool,
             }
         )
         return self.async_show_form(step_id="init", data_schema=schema)
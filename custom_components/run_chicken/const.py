@@ -7,10 +7,51 @@ LOGGER: Logger = getLogger(__package__)
 DOMAIN = "run_chicken"
 
 DEFAULT_SCAN_INTERVAL = 300
+# Adaptive polling bounds: tightened after a reconnect, stretched while push
+# notifications are healthy.
+MIN_SCAN_INTERVAL = 60
+MAX_SCAN_INTERVAL = 3600
+# Push counts as healthy only if a notification arrived this many seconds ago
+# at most; kept short so the hello reply of a reconnect can't carry polling far.
+PUSH_HEALTHY_WINDOW = 600
+
+# Fleet-wide scheduling: polls and commands allowed in flight at once per
+# adapter or proxy among those that have to connect first (an operation on a
+# link that is already open isn't queued), and the minimum spacing in seconds
+# between poll starts on one adapter.
+MAX_CONNECTIONS_PER_ADAPTER = 2
+POLL_STAGGER = 2
+
+# After a command, watch the door this long for it to reach the target state,
+# reading every COMMAND_BURST_INTERVAL seconds if no notification confirms it.
+COMMAND_BURST_WINDOW = 60
+COMMAND_BURST_INTERVAL = 2
+# Number of recent command actuation latencies kept per door.
+ACTUATION_HISTORY = 20
 EVENT_DEBOUNCE_TIME = 10
+# Debug records per second, per door, for advertisements and notifications;
+# the rest are counted and the count is logged with the next record.
+LOG_SAMPLE_RATE = 2
+# Notification rate is reported over this many seconds, from at most
+# NOTIFICATION_HISTORY recent arrival times.
+NOTIFICATION_RATE_WINDOW = 3600
+NOTIFICATION_HISTORY = 256
 
 # Options-flow key: when set, raw inbound payloads are appended to a debug file.
 CONF_RECORD_RAW_BYTES = "record_raw_bytes"
+# Options-flow key: recording format, "text" (base64 lines) or "binary" (compact).
+CONF_RECORD_FORMAT = "record_format"
+# Options-flow key: seconds to merge advertisement/reconnect refresh triggers over.
+CONF_REFRESH_DEBOUNCE = "refresh_debounce"
+# Options-flow key: seconds to coalesce bursts of repeated notifications over
+# (0 publishes every notification at once, the default).
+CONF_NOTIFY_COALESCE = "notify_coalesce"
+# Options-flow key: when set, connect/subscribe/hello/read/write phases are
+# timed into a buffer shared by every door, exported with the diagnostics.
+CONF_TRACE_PHASES = "trace_phases"
+# Options-flow key: seconds of inactivity before the connection is released
+# (0 keeps it open, the default).
+CONF_IDLE_TIMEOUT = "idle_timeout"
 
 READ_SERVICE_UUID = "0000004f-cc7a-482a-984a-7f2ed5b3e58f"
 READ_CHAR_UUID = "00000001-8e22-4541-9d4c-21edae82ed19"
@@ -19,3 +60,7 @@ WRITE_SERVICE_UUID = "00000000-cc7a-482a-984a-7f2ed5b3e58f"
 WRITE_CHAR_UUID = "00000000-8e22-4541-9d4c-21edae82ed19"
 
 MANUFACTURER_ID = 43521
+
+# Batch onboarding probes this many doors at once: far quicker than one at a
+# time on a large install, without storming the adapters.
+BATCH_PROBE_CONCURRENCY = 3
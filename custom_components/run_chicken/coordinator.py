@@ -2,21 +2,51 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
+import time
+from collections import deque
 from datetime import timedelta
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
+from bleak.exc import BleakError
 from homeassistant.components.bluetooth import (
     BluetoothCallbackMatcher,
     BluetoothScanningMode,
+    async_last_service_info,
     async_register_callback,
 )
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DEFAULT_SCAN_INTERVAL, DOMAIN
-from .run_chicken_ble.models import RunChickenDeviceData
+from .const import (
+    ACTUATION_HISTORY,
+    COMMAND_BURST_INTERVAL,
+    COMMAND_BURST_WINDOW,
+    CONF_NOTIFY_COALESCE,
+    CONF_REFRESH_DEBOUNCE,
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+    EVENT_DEBOUNCE_TIME,
+    LOG_SAMPLE_RATE,
+    MANUFACTURER_ID,
+    MAX_SCAN_INTERVAL,
+    MIN_SCAN_INTERVAL,
+    NOTIFICATION_HISTORY,
+    NOTIFICATION_RATE_WINDOW,
+    PUSH_HEALTHY_WINDOW,
+)
+from .fleet import FleetPriority
+from .run_chicken_ble.exceptions import RunChickenError
+from .run_chicken_ble.log import LogSampler
+from .run_chicken_ble.models import RunChickenDeviceData, RunChickenDoorState
+from .run_chicken_ble.protocol import parse_advertisement
+from .scheduler import AdaptivePollInterval, NotificationCoalescer, RefreshScheduler, RefreshTrigger
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Coroutine
+
     from bleak import BleakGATTCharacteristic
     from homeassistant.components.bluetooth import (
         BluetoothChange,
@@ -25,9 +55,15 @@ if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
 
     from . import RunChickenConfigEntry
+    from .fleet import RunChickenFleetScheduler
     from .run_chicken_ble.device import RunChickenDevice
+    from .storage import RunChickenStore
 
 _LOGGER = logging.getLogger(__name__)
+# A fleet of doors produces thousands of advertisements a minute, all handled
+# on the event loop; even at debug level only a few per door are logged.
+_ADVERTISEMENT_LOG = LogSampler(_LOGGER, LOG_SAMPLE_RATE)
+_NOTIFICATION_LOG = LogSampler(_LOGGER, LOG_SAMPLE_RATE)
 
 
 class RunChickenCoordinator(DataUpdateCoordinator[RunChickenDeviceData]):
@@ -35,7 +71,14 @@ class RunChickenCoordinator(DataUpdateCoordinator[RunChickenDeviceData]):
 
     config_entry: RunChickenConfigEntry
 
-    def __init__(self, hass: HomeAssistant, entry: RunChickenConfigEntry, device: RunChickenDevice) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: RunChickenConfigEntry,
+        device: RunChickenDevice,
+        fleet: RunChickenFleetScheduler,
+        store: RunChickenStore,
+    ) -> None:
         """Initialize the coordinator for a single Run-Chicken device."""
         super().__init__(
             hass,
@@ -43,50 +86,260 @@ class RunChickenCoordinator(DataUpdateCoordinator[RunChickenDeviceData]):
             config_entry=entry,
             name=DOMAIN,
             update_interval=timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+            # Only notify entities when a poll actually changed the state.
+            always_update=False,
         )
         self.device = device
+        # Shared by every door so connects and polls don't storm an adapter.
+        self.fleet = fleet
+        # Holds the last known state so a restart doesn't wait on BLE.
+        self.store = store
+        # Advertisement, reconnect and interval-poll triggers all funnel through
+        # here so the door sees at most one read at a time.
+        self.refresh_scheduler = RefreshScheduler(
+            hass,
+            self.async_refresh,
+            entry.options.get(CONF_REFRESH_DEBOUNCE, EVENT_DEBOUNCE_TIME),
+        )
+        # Optionally collapses bursts of repeated notifications (command replies,
+        # reconnects); a changed state is always published at once.
+        self.notification_coalescer: NotificationCoalescer[RunChickenDeviceData] = NotificationCoalescer(
+            hass,
+            self._async_publish_notification,
+            lambda: self.data,
+            entry.options.get(CONF_NOTIFY_COALESCE, 0),
+        )
+        self.poll_interval = AdaptivePollInterval(
+            DEFAULT_SCAN_INTERVAL, MIN_SCAN_INTERVAL, MAX_SCAN_INTERVAL, PUSH_HEALTHY_WINDOW
+        )
+        # Monotonic time of the last push notification; drives the poll interval.
+        self.last_notification: float | None = None
+        # Recent notification arrival times (monotonic), for the rate sensor.
+        self._notification_times: deque[float] = deque(maxlen=NOTIFICATION_HISTORY)
+        # Signal strength of the latest advertisement, in dBm.
+        self.rssi: int | None = None
+        # Set while the door runs from stored state and hasn't advertised yet:
+        # its BLEDevice is a placeholder, so there is nothing to connect to.
+        self._awaiting_advertisement = False
+        # Set on every notification so a command burst can wake without polling.
+        self._notified = asyncio.Event()
+        # Seconds from command TX to the door confirming the target state.
+        self.actuation_latencies: deque[float] = deque(maxlen=ACTUATION_HISTORY)
+        self._burst_task: asyncio.Task[None] | None = None
+
+    @property
+    def adapter(self) -> str:
+        """Return the adapter or proxy the door was last heard through."""
+        service_info = async_last_service_info(self.hass, self.device.address, connectable=True)
+        return service_info.source if service_info is not None else "unknown"
+
+    @property
+    def notification_age(self) -> float | None:
+        """Return seconds since the last push notification, or None if none yet."""
+        if self.last_notification is None:
+            return None
+        return time.monotonic() - self.last_notification
+
+    @property
+    def notification_rate(self) -> int:
+        """Return the number of push notifications received in the last ``NOTIFICATION_RATE_WINDOW`` seconds."""
+        cutoff = time.monotonic() - NOTIFICATION_RATE_WINDOW
+        return sum(1 for received in self._notification_times if received >= cutoff)
 
     async def async_init(self) -> None:
-        """Connect, subscribe to notifications, and wire up reconnect handling."""
+        """
+        Restore the last known state and wire up BLE events, without connecting.
+
+        Entities come up immediately with the restored (or unknown) state; the
+        first connection, which also subscribes to notifications, is made in the
+        background so setup time doesn't grow with the number of doors. A door
+        that isn't advertising yet is first connected to once it does.
+        """
         # Reconnect on an unexpected disconnect; the closure reads the callback
         # at disconnect time, so setting it before the first refresh is fine.
         self.device.disconnect_callback = self._schedule_reconnect
+        self.config_entry.async_on_unload(self.refresh_scheduler.async_cancel)
+        self.config_entry.async_on_unload(self.notification_coalescer.async_cancel)
 
-        await self.async_config_entry_first_refresh()
-
+        # There's no client yet, so this only stores the callback; it is
+        # subscribed as part of every (re)connect.
         await self.device.register_notification_callback(self._handle_notification)
 
         # Refresh when the door advertises again (e.g. after dropping the link).
+        # Everything we use is in the primary advertisement (the door's scan
+        # response is empty), so passive scanning is enough.
         self.config_entry.async_on_unload(
             async_register_callback(
                 self.hass,
                 self._handle_bluetooth_event,
                 BluetoothCallbackMatcher(address=self.device.address),
-                BluetoothScanningMode.ACTIVE,
+                BluetoothScanningMode.PASSIVE,
             )
         )
 
+        self.data = self.store.data or RunChickenDeviceData()
+        self.config_entry.async_on_unload(self.async_add_listener(self._async_save_state))
+        if async_last_service_info(self.hass, self.device.address, connectable=True) is None:
+            # The advertisement callback triggers the first refresh instead.
+            self._awaiting_advertisement = True
+            return
+        self.config_entry.async_create_background_task(self.hass, self.async_refresh(), f"{DOMAIN}_first_refresh")
+
+    @callback
+    def _async_save_state(self) -> None:
+        """Persist the latest state so the next startup can restore it."""
+        self.store.async_save(self.device.name, self.data)
+
     async def _async_update_data(self) -> RunChickenDeviceData:
         """Fetch the latest door state over BLE (also reconnects if needed)."""
+        if self._awaiting_advertisement:
+            # Keep the restored state instead of failing against the placeholder.
+            return self.data
         _LOGGER.debug("Polling Run-Chicken device %s", self.device.address)
-        return await self.device.poll_device()
+        try:
+            data = await self.refresh_scheduler.async_run(self._async_poll)
+        except RunChickenError as err:
+            # The BLE package doesn't know about Home Assistant; report its errors
+            # the way the coordinator expects a failed update.
+            raise UpdateFailed(str(err)) from err
+        # The coordinator reads this when it schedules the next poll.
+        self.update_interval = timedelta(
+            seconds=self.poll_interval.next_interval(
+                connected=self.device.is_connected,
+                notification_age=self.notification_age,
+            )
+        )
+        return data
+
+    async def _async_poll(self, priority: FleetPriority = FleetPriority.POLL) -> RunChickenDeviceData:
+        """Read the door state once the fleet scheduler hands us a slot."""
+        async with self.fleet.async_slot(self.adapter, priority, limited=self._needs_connect):
+            return await self.device.poll_device()
+
+    @property
+    def _needs_connect(self) -> bool:
+        """Whether the next operation has to open a link, and so takes one of the adapter's fleet slots."""
+        # An idle-release link may be let go before the queued operation runs.
+        return self.device.idle_timeout is not None or not self.device.is_connected
+
+    async def async_open(self) -> None:
+        """Open the door, then watch it closely until it reports open."""
+        await self._async_command(self.device.async_open, RunChickenDoorState.OPEN)
+
+    async def async_close(self) -> None:
+        """Close the door, then watch it closely until it reports closed."""
+        await self._async_command(self.device.async_close, RunChickenDoorState.CLOSED)
+
+    async def _async_command(
+        self,
+        send: Callable[[], Coroutine[Any, Any, bool]],
+        target: RunChickenDoorState,
+    ) -> None:
+        """Send a command and start a burst that tracks the door to ``target``."""
+        async with self.fleet.async_slot(self.adapter, FleetPriority.COMMAND, limited=self._needs_connect):
+            sent = await send()
+        # Replaced by a newer command while queued; that one's caller tracks it.
+        if not sent:
+            return
+        sent_at = time.monotonic()
+        # A newer command supersedes whatever the previous burst was waiting for.
+        if self._burst_task is not None:
+            self._burst_task.cancel()
+        self._burst_task = self.config_entry.async_create_background_task(
+            self.hass, self._async_track_command(target, sent_at), f"{DOMAIN}_command_burst"
+        )
+
+    async def _async_track_command(self, target: RunChickenDoorState, sent_at: float) -> None:
+        """
+        Watch the door for up to ``COMMAND_BURST_WINDOW`` seconds after a command.
+
+        The door pushes its new state once it stops moving, so while
+        notifications are flowing we just wait for them. If nothing has been
+        pushed since the command was sent, the subscription may be dead, so read
+        the state every ``COMMAND_BURST_INTERVAL`` seconds instead. While the
+        motor runs the door keeps reporting where it started from, so the target
+        only counts once the motor has stopped (a door reversed mid-travel
+        already reports the target it is heading back to).
+        """
+        deadline = sent_at + COMMAND_BURST_WINDOW
+        while (remaining := deadline - time.monotonic()) > 0:
+            if self.data is not None and self.data.door_state is target and not self.data.motor_running:
+                latency = time.monotonic() - sent_at
+                self.actuation_latencies.append(latency)
+                _LOGGER.debug("Run-Chicken %s reached %s in %.1fs", self.device.address, target.name, latency)
+                return
+            self._notified.clear()
+            try:
+                async with asyncio.timeout(min(COMMAND_BURST_INTERVAL, remaining)):
+                    await self._notified.wait()
+            except TimeoutError:
+                if self.last_notification is not None and self.last_notification >= sent_at:
+                    continue
+                try:
+                    # Served like a command: the user is waiting on this read.
+                    data = await self.refresh_scheduler.async_run(
+                        functools.partial(self._async_poll, FleetPriority.COMMAND)
+                    )
+                except (BleakError, TimeoutError, RunChickenError):
+                    _LOGGER.debug("Burst read of Run-Chicken %s failed", self.device.address, exc_info=True)
+                    continue
+                self._async_set_if_changed(data)
+        _LOGGER.debug("Run-Chicken %s did not report %s after the command", self.device.address, target.name)
 
     def _handle_notification(self, _gatt_char: BleakGATTCharacteristic, payload: bytearray) -> None:
-        """Push a device notification payload into the coordinator."""
-        _LOGGER.debug("Handling notification payload")
-        self.async_set_updated_data(self.device.data_from_bytes(payload))
+        """Push a device notification payload into the coordinator, if it changed anything."""
+        if (suppressed := _NOTIFICATION_LOG.sample(self.device.address)) is not None:
+            _LOGGER.debug(
+                "Notification from Run-Chicken %s: %s (%d not logged)", self.device.address, payload.hex(), suppressed
+            )
+        self.last_notification = time.monotonic()
+        self._notification_times.append(self.last_notification)
+        self.notification_coalescer.async_submit(self.device.data_from_bytes(payload))
+
+    @callback
+    def _async_publish_notification(self, data: RunChickenDeviceData) -> None:
+        """Publish a (possibly coalesced) notified state and wake any command burst."""
+        self._async_set_if_changed(data)
+        self._notified.set()
+
+    @callback
+    def _async_set_if_changed(self, data: RunChickenDeviceData) -> None:
+        """
+        Push ``data`` to the listeners unless it is the state they already have.
+
+        Snapshots are interned, so an unchanged state is the same object. A
+        chatty door repeating itself then costs no state write (and no recorder
+        row); a push after a failed poll still goes out, to clear the failure.
+        """
+        if data is not self.data or not self.last_update_success:
+            self.async_set_updated_data(data)
 
     # BluetoothChange is a functional Enum (Enum("BluetoothChange", ...)) that
     # PyCharm can't use as a type annotation, though the hint is correct for ty.
     # noinspection PyTypeHints
     def _handle_bluetooth_event(self, service_info: BluetoothServiceInfoBleak, change: BluetoothChange) -> None:
-        """Refresh on a Bluetooth advertisement (reconnects and re-subscribes)."""
-        _LOGGER.debug("BLE event received: %s, change %s", service_info, change)
+        """Decode a Bluetooth advertisement and refresh if it tells us something new."""
+        if (suppressed := _ADVERTISEMENT_LOG.sample(service_info.address)) is not None:
+            _LOGGER.debug("BLE event received: %s, change %s (%d not logged)", service_info, change, suppressed)
         # Keep the device's BLEDevice fresh so reconnects use the best path.
         self.device.ble_device = service_info.device
-        self.hass.async_create_task(self.async_request_refresh(), f"{DOMAIN}_advertisement_refresh")
+        self._awaiting_advertisement = False
+        self.rssi = service_info.rssi
+
+        previous = self.device.advertisement
+        self.device.advertisement = parse_advertisement(service_info.manufacturer_data.get(MANUFACTURER_ID, b""))
+        # The door doesn't advertise its state, so while the link is up push
+        # notifications already carry everything an advertisement could. Only
+        # refresh (which reconnects and re-subscribes) when the link dropped or
+        # the advertised payload changed; a link we released for being idle
+        # stays down until the next poll or command needs it.
+        settled = self.device.is_connected or self.device.idle_released
+        if settled and self.device.advertisement == previous:
+            return
+        self.refresh_scheduler.async_trigger(RefreshTrigger.ADVERTISEMENT)
 
     def _schedule_reconnect(self) -> None:
         """Reconnect after an unexpected disconnect so push updates resume."""
         _LOGGER.debug("Run-Chicken %s disconnected; scheduling reconnect", self.device.address)
-        self.hass.async_create_task(self.async_request_refresh(), f"{DOMAIN}_reconnect")
+        self.poll_interval.async_note_reconnect()
+        self.refresh_scheduler.async_trigger(RefreshTrigger.RECONNECT)
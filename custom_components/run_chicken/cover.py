@@ -10,6 +10,7 @@ from homeassistant.components.cover import (
     CoverEntity,
     CoverEntityDescription,
 )
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import (
     CONNECTION_BLUETOOTH,
     DeviceInfo,
@@ -26,6 +27,7 @@ if TYPE_CHECKING:
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
     from . import RunChickenConfigEntry
+    from .run_chicken_ble.models import RunChickenDeviceData
 
 ENTITY_DESCRIPTIONS = CoverEntityDescription(
     key="run_chicken",
@@ -56,6 +58,8 @@ class RunChickenCoverEntity(CoordinatorEntity[RunChickenCoordinator], CoverEntit
         self.run_chicken_device = coordinator.device
 
         self._attr_unique_id = f"run_chicken_{self.run_chicken_device.address}"
+        # The (snapshot, availability) pair behind the last state write.
+        self._last_written: tuple[RunChickenDeviceData, bool] | None = None
 
         self._attr_device_info = DeviceInfo(
             connections={
@@ -76,16 +80,37 @@ class RunChickenCoverEntity(CoordinatorEntity[RunChickenCoordinator], CoverEntit
             return None
         return self.coordinator.data.door_state is RunChickenDoorState.CLOSED
 
+    @property
+    def is_opening(self) -> bool | None:
+        """Return True while the motor is running away from closed."""
+        data = self.coordinator.data
+        if data.motor_running is None:
+            return None
+        # The door reports its old position until it stops moving.
+        return data.motor_running and data.door_state is RunChickenDoorState.CLOSED
+
+    @property
+    def is_closing(self) -> bool | None:
+        """Return True while the motor is running away from open."""
+        data = self.coordinator.data
+        if data.motor_running is None:
+            return None
+        return data.motor_running and data.door_state is RunChickenDoorState.OPEN
+
     async def async_open_cover(self, **kwargs: Any) -> None:  # noqa: ARG002
         """Open the coop door (the device reconnects first if needed)."""
-        await self.run_chicken_device.async_open()
+        await self.coordinator.async_open()
 
     async def async_close_cover(self, **kwargs: Any) -> None:  # noqa: ARG002
         """Close the coop door (the device reconnects first if needed)."""
-        await self.run_chicken_device.async_close()
+        await self.coordinator.async_close()
 
+    @callback
     def _handle_coordinator_update(self) -> None:
-        """Handle data update."""
+        """Write the new state, unless it is exactly what was last written."""
         _LOGGER.debug("Received data update from coordinator: %s", self.coordinator.data)
-        self._attr_is_closed = self.coordinator.data.door_state is RunChickenDoorState.CLOSED
+        written = (self.coordinator.data, self.available)
+        if written == self._last_written:
+            return
+        self._last_written = written
         self.async_write_ha_state()
@@ -0,0 +1,71 @@
+"""Diagnostics support for the Run-Chicken integration."""
+
+from __future__ import annotations
+
+import dataclasses
+import time
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.diagnostics import async_redact_data
+
+from .fleet import FLEET_KEY
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from . import RunChickenConfigEntry
+
+# Coordinates the app configured on the door; coarse, but still a location.
+TO_REDACT = {"latitude", "longitude"}
+
+# The same coordinates as raw bytes: [9..12] of a status frame (see
+# RunChickenProtocol.status_frame). Command frames only pad there, so every
+# exported frame is masked without looking at its type.
+_COORDINATES = slice(9, 13)
+
+
+def _masked_hex(payload: bytes) -> str:
+    """Hex-encode a raw frame with its coordinate bytes replaced by ``**``."""
+    masked = payload[_COORDINATES]
+    return payload[: _COORDINATES.start].hex() + "**" * len(masked) + payload[_COORDINATES.stop :].hex()
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: RunChickenConfigEntry) -> dict[str, Any]:
+    """Return diagnostics for a config entry, including the door's recent raw frames."""
+    coordinator = entry.runtime_data
+    device = coordinator.device
+    now = time.monotonic()
+    data = coordinator.data
+    fleet = hass.data.get(FLEET_KEY)
+
+    diagnostics = {
+        "device": {
+            "address": device.address,
+            "name": device.name,
+            "model": device.model,
+            "connected": device.is_connected,
+            "connection_state": device.connection_state.value,
+            "idle_released": device.idle_released,
+        },
+        "data": {**dataclasses.asdict(data), "door_state": data.door_state.name} if data is not None else None,
+        "connection": dataclasses.asdict(device.connection_stats),
+        "commands": {
+            **dataclasses.asdict(device.command_queue.stats),
+            "recent": [dataclasses.asdict(timing) for timing in device.command_queue.timings],
+        },
+        "refresh": dataclasses.asdict(coordinator.refresh_scheduler.stats),
+        "notifications": dataclasses.asdict(coordinator.notification_coalescer.stats),
+        "poll_interval": coordinator.poll_interval.seconds,
+        "notification_age": coordinator.notification_age,
+        "actuation_latencies": list(coordinator.actuation_latencies),
+        # Chrome trace-event JSON (every traced door); save it as a .json file
+        # and open it in chrome://tracing or ui.perfetto.dev.
+        "trace": device.tracer.export() if device.tracer is not None else None,
+        "fleet": {source: dataclasses.asdict(stats) for source, stats in fleet.stats.items()} if fleet else {},
+        # Oldest first; ages in seconds relative to now; coordinates masked.
+        "frames": [
+            {"age": round(now - timestamp, 3), "direction": direction, "payload": _masked_hex(payload)}
+            for timestamp, direction, payload in device.frame_log
+        ],
+    }
+    return async_redact_data(diagnostics, TO_REDACT)
@@ -0,0 +1,151 @@
+"""Fleet-wide BLE connection scheduling shared by every Run-Chicken door."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import dataclasses
+import heapq
+import itertools
+import logging
+from enum import IntEnum
+from typing import TYPE_CHECKING
+
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN, MAX_CONNECTIONS_PER_ADAPTER, POLL_STAGGER
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
+_LOGGER = logging.getLogger(__name__)
+
+#: Where the shared scheduler lives in ``hass.data``.
+FLEET_KEY: HassKey[RunChickenFleetScheduler] = HassKey(DOMAIN)
+
+
+class FleetPriority(IntEnum):
+    """Queue priority for a BLE operation; lower values are served first."""
+
+    COMMAND = 0
+    POLL = 1
+
+
+@dataclasses.dataclass
+class FleetQueueStats:
+    """Queue metrics for one adapter or proxy; wait times are in seconds."""
+
+    #: Operations currently waiting for a slot.
+    depth: int = 0
+    #: Deepest the queue has been.
+    max_depth: int = 0
+    #: Operations that have been given a slot.
+    granted: int = 0
+    #: How long the most recent operation waited for its slot.
+    last_wait: float | None = None
+    #: Sum of all slot waits (divide by ``granted`` for the mean).
+    total_wait: float = 0.0
+
+
+class _AdapterQueue:
+    """Priority-ordered slots for the BLE operations of a single adapter."""
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.active = 0
+        self.stats = FleetQueueStats()
+        # Loop time at which the next poll on this adapter may start.
+        self.next_poll_start = 0.0
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+
+    async def acquire(self, priority: FleetPriority) -> None:
+        """Wait for a slot, ahead of any queued operation of lower priority."""
+        if self.active < self.limit and not self._waiters:
+            self.active += 1
+            return
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+        self.stats.depth = len(self._waiters)
+        self.stats.max_depth = max(self.stats.max_depth, self.stats.depth)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Granted just as we were cancelled; hand the slot on.
+                self.release()
+            else:
+                self._waiters = [waiter for waiter in self._waiters if waiter[2] is not future]
+                heapq.heapify(self._waiters)
+                self.stats.depth = len(self._waiters)
+            raise
+
+    def release(self) -> None:
+        """Free a slot and hand it to the highest-priority waiter, if any."""
+        self.active -= 1
+        while self._waiters:
+            _priority, _sequence, future = heapq.heappop(self._waiters)
+            if not future.done():
+                self.active += 1
+                future.set_result(None)
+                break
+        self.stats.depth = len(self._waiters)
+
+
+class RunChickenFleetScheduler:
+    """
+    Share BLE access fairly between every configured Run-Chicken door.
+
+    Each adapter or proxy runs at most ``max_connections`` operations that have
+    to connect first at once, with commands queued ahead of polls, so doors
+    reconnecting together (say, after a proxy restart) don't storm it. An
+    operation on a link that is already open skips the queue: it costs the
+    adapter no connect. Polls on the same adapter are spread ``poll_stagger``
+    seconds apart either way, so doors whose intervals line up don't all reach
+    the adapter at the same moment.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = MAX_CONNECTIONS_PER_ADAPTER,
+        poll_stagger: float = POLL_STAGGER,
+    ) -> None:
+        """Initialise an empty scheduler."""
+        self._max_connections = max_connections
+        self._poll_stagger = poll_stagger
+        self._adapters: dict[str, _AdapterQueue] = {}
+
+    @property
+    def stats(self) -> dict[str, FleetQueueStats]:
+        """Return queue metrics keyed by adapter or proxy source."""
+        return {source: queue.stats for source, queue in self._adapters.items()}
+
+    @contextlib.asynccontextmanager
+    async def async_slot(self, source: str, priority: FleetPriority, *, limited: bool = True) -> AsyncGenerator[None]:
+        """Hold one of ``source``'s connect slots for the body of the block (just stagger if not ``limited``)."""
+        queue = self._adapters.get(source)
+        if queue is None:
+            queue = self._adapters[source] = _AdapterQueue(self._max_connections)
+
+        loop = asyncio.get_running_loop()
+        if priority is FleetPriority.POLL:
+            start = max(loop.time(), queue.next_poll_start)
+            queue.next_poll_start = start + self._poll_stagger
+            if (delay := start - loop.time()) > 0:
+                _LOGGER.debug("Staggering poll on %s by %.1fs", source, delay)
+                await asyncio.sleep(delay)
+
+        if not limited:
+            yield
+            return
+
+        enqueued = loop.time()
+        await queue.acquire(priority)
+        wait = loop.time() - enqueued
+        queue.stats.granted += 1
+        queue.stats.last_wait = wait
+        queue.stats.total_wait += wait
+        try:
+            yield
+        finally:
+            queue.release()
@@ -3,61 +3,166 @@
 from __future__ import annotations
 
 import asyncio
-import base64
-import datetime as dt
+import gzip
 import logging
+import shutil
+import time
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import IO, TYPE_CHECKING
+
+from .run_chicken_ble.recording import BINARY_MAGIC, RecordFormat, encode_messages
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
 
 _LOGGER = logging.getLogger(__name__)
 
+# Rotate once the live file reaches this size or age, keeping this many backups.
+DEFAULT_MAX_BYTES = 5 * 1024 * 1024
+DEFAULT_MAX_AGE = 24 * 60 * 60
+DEFAULT_BACKUPS = 3
+# Messages buffered in memory for the writer; anything beyond is dropped.
+DEFAULT_QUEUE_SIZE = 1024
+# Most messages the writer takes off the queue for a single write.
+BATCH_SIZE = 256
+
 
 class RawByteRecorder:
     """
-    Append every raw message exchanged with the door to a text file for debugging.
-
-    Each line is ``<ISO-8601 UTC timestamp> <RX|TX> <base64 payload>``, where RX
-    is a payload received from the door and TX is one sent to it. Writes run on
-    the executor (off the event loop) and are serialised through a lock so
-    concurrent reads and writes never interleave a line. This is an opt-in
-    debugging aid enabled from the integration options; the file is meant to be
-    handed to a maintainer when reporting an issue.
+    Append every raw message exchanged with the door to a file for debugging.
+
+    ``record`` only puts the message on a bounded in-memory queue, so it is cheap
+    on the event loop. A single background writer drains the queue in batches
+    and appends them through one file handle kept open on the executor. When the
+    queue is full, new messages are dropped, which keeps the capture leading up
+    to the problem intact, and counted in ``dropped``. The file is rotated by
+    size or age, and older files are optionally gzip-compressed. This is an
+    opt-in debugging aid enabled from the integration options; the files are
+    meant to be handed to a maintainer when reporting an issue.
     """
 
-    def __init__(self, hass: HomeAssistant, path: str | Path) -> None:
+    def __init__(  # noqa: PLR0913
+        self,
+        hass: HomeAssistant,
+        path: str | Path,
+        *,
+        record_format: RecordFormat = RecordFormat.TEXT,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_age: float | None = DEFAULT_MAX_AGE,
+        backups: int = DEFAULT_BACKUPS,
+        compress: bool = True,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+    ) -> None:
         """Initialise a recorder that appends to ``path``."""
         self._hass = hass
         self._path = Path(path)
-        self._lock = asyncio.Lock()
+        self._format = record_format
+        self._max_bytes = max_bytes
+        self._max_age = max_age
+        self._backups = backups
+        self._compress = compress
+        self._queue: asyncio.Queue[tuple[float, str, bytes] | None] = asyncio.Queue(queue_size)
+        self._writer: asyncio.Task[None] | None = None
+        # Only touched from the executor.
+        self._file: IO[bytes] | None = None
+        self._opened_at = 0.0
+        #: Messages discarded because the queue was full.
+        self.dropped = 0
 
     @property
     def path(self) -> Path:
         """Return the file the recorder appends to."""
         return self._path
 
+    def async_start(self) -> None:
+        """Start the background writer."""
+        self._writer = self._hass.async_create_background_task(self._async_write_loop(), "run_chicken_raw_recorder")
+
+    async def async_stop(self) -> None:
+        """Write out everything queued so far, then stop the writer and close the file."""
+        if self._writer is None:
+            return
+        await self._queue.put(None)
+        await self._writer
+        self._writer = None
+
     def record(self, direction: str, payload: bytes | bytearray) -> None:
         """
         Queue a message to be appended. Safe to call from the event loop.
 
         ``direction`` is a short marker (``"RX"`` for received, ``"TX"`` for sent)
-        written verbatim before the base64 payload.
+        stored alongside the payload.
         """
-        encoded = base64.b64encode(payload).decode("ascii")
-        line = f"{dt.datetime.now(dt.UTC).isoformat()} {direction} {encoded}\n"
-        self._hass.async_create_task(self._async_append(line), "run_chicken_raw_record")
+        try:
+            self._queue.put_nowait((time.time(), direction, bytes(payload)))
+        except asyncio.QueueFull:
+            self.dropped += 1
 
-    async def _async_append(self, line: str) -> None:
-        """Append a single line, serialised against any other in-flight write."""
-        async with self._lock:
-            await self._hass.async_add_executor_job(self._append, line)
+    async def _async_write_loop(self) -> None:
+        """Drain the queue in batches until ``async_stop`` enqueues the sentinel."""
+        try:
+            while True:
+                batch = [await self._queue.get()]
+                while len(batch) < BATCH_SIZE and not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                stopping = batch[-1] is None
+                messages = [message for message in batch if message is not None]
+                if messages:
+                    await self._hass.async_add_executor_job(self._write, encode_messages(self._format, messages))
+                if stopping:
+                    return
+        finally:
+            await self._hass.async_add_executor_job(self._close)
 
-    def _append(self, line: str) -> None:
-        """Blocking append; runs on the executor."""
+    def _write(self, data: bytes) -> None:
+        """Blocking append of one batch, rotating first if due; runs on the executor."""
         try:
-            with self._path.open("a", encoding="utf-8") as file:
-                file.write(line)
+            if self._file is not None and self._rotation_due(self._file):
+                self._rotate()
+            file = self._file or self._open()
+            file.write(data)
+            file.flush()
         except OSError:
             _LOGGER.exception("Failed to write raw-byte recording to %s", self._path)
+
+    def _open(self) -> IO[bytes]:
+        """Open (or create) the live file; a new binary file starts with the magic."""
+        self._file = file = self._path.open("ab")
+        self._opened_at = time.monotonic()
+        if self._format is RecordFormat.BINARY and file.tell() == 0:
+            file.write(BINARY_MAGIC)
+        return file
+
+    def _close(self) -> None:
+        """Close the live file, if open."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _rotation_due(self, file: IO[bytes]) -> bool:
+        """Return whether the live file has reached its size or age limit."""
+        if file.tell() >= self._max_bytes:
+            return True
+        return self._max_age is not None and time.monotonic() - self._opened_at >= self._max_age
+
+    def _rotate(self) -> None:
+        """Shift ``path`` to ``path.1`` (compressing it if enabled), dropping the oldest backup."""
+        self._close()
+        if self._backups < 1:
+            self._path.unlink(missing_ok=True)
+            return
+        suffix = ".gz" if self._compress else ""
+        for index in range(self._backups - 1, 0, -1):
+            older = self._backup_path(index, suffix)
+            if older.exists():
+                older.replace(self._backup_path(index + 1, suffix))
+        first = self._backup_path(1, "")
+        self._path.replace(first)
+        if self._compress:
+            with first.open("rb") as source, gzip.open(self._backup_path(1, suffix), "wb") as target:
+                shutil.copyfileobj(source, target)
+            first.unlink()
+
+    def _backup_path(self, index: int, suffix: str) -> Path:
+        """Return the path of the ``index``-th backup."""
+        return self._path.with_name(f"{self._path.name}.{index}{suffix}")
@@ -7,15 +7,45 @@ representing the parsed data:
 
 - `RunChickenDevice` — BLE interface for sending commands and reading payloads
 - `RunChickenDeviceData` — immutable snapshot of the door's observed state
+- `RunChickenError` — base of the exceptions the package raises itself
 
-Safe to import: no side effects at import time. The explicit `__all__`
+Safe to import: no side effects at import time, and no dependency on Home
+Assistant. Bleak is only loaded once a device actually connects, and the
+names below are imported on first access, so tooling that only needs
+``protocol`` or ``models`` doesn't pay for the rest. The explicit `__all__`
 defines the public surface of the package.
 """
 
-from .device import RunChickenDevice
-from .models import RunChickenDeviceData
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .device import RunChickenDevice
+    from .exceptions import RunChickenError
+    from .models import RunChickenDeviceData
 
 __all__ = [
     "RunChickenDevice",
     "RunChickenDeviceData",
+    "RunChickenError",
 ]
+
+# Public name -> submodule defining it.
+_LAZY_EXPORTS = {
+    "RunChickenDevice": ".device",
+    "RunChickenDeviceData": ".models",
+    "RunChickenError": ".exceptions",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name from its submodule on first access."""
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
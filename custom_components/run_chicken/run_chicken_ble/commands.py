@@ -0,0 +1,119 @@
+"""Per-door queue that serializes GATT operations."""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import time
+from collections import deque
+from typing import TYPE_CHECKING
+
+from .models import RunChickenCommandStats, RunChickenCommandTiming
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+#: Recent operation timings kept per door for diagnostics.
+COMMAND_HISTORY = 32
+
+
+@dataclasses.dataclass
+class _QueuedMove:
+    """An open/close waiting for its turn; replaced in place if superseded."""
+
+    name: str
+    operation: Callable[[], Awaitable[None]]
+    queued_at: float
+    superseded: int = 0
+    task: asyncio.Task[None] | None = None
+
+
+class RunChickenCommandQueue:
+    """
+    Run one GATT operation at a time against a door.
+
+    The door only handles one exchange at a time, and a write racing a read (or
+    a second connect) on the same link just fails, so every poll and command
+    goes through here in arrival order. Anything that finds the link already up
+    (a poll queued behind a command, say) reuses that connection.
+
+    Door moves are special: only the latest one matters. While an open or close
+    is still waiting its turn, a newer one replaces it rather than queueing
+    behind it, and every caller of the replaced request awaits the newer one.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty queue."""
+        self._lock = asyncio.Lock()
+        self._queued_move: _QueuedMove | None = None
+        self.stats = RunChickenCommandStats()
+        # Most recent operations, oldest first.
+        self.timings: deque[RunChickenCommandTiming] = deque(maxlen=COMMAND_HISTORY)
+        # The most recent timing for each operation name, and for any door move.
+        self.latest: dict[str, RunChickenCommandTiming] = {}
+        self.last_move: RunChickenCommandTiming | None = None
+
+    @property
+    def busy(self) -> bool:
+        """Return whether an operation is running or waiting."""
+        return self._lock.locked()
+
+    async def async_run[T](self, name: str, operation: Callable[[], Awaitable[T]]) -> T:
+        """Run ``operation`` once everything queued before it has finished."""
+        queued_at = time.monotonic()
+        async with self._lock:
+            return await self._async_timed(name, operation, queued_at)
+
+    async def async_move(self, name: str, operation: Callable[[], Awaitable[None]]) -> bool:
+        """
+        Queue a door move, replacing any move that hasn't started yet.
+
+        Returns whether this request is the one that ran: ``False`` if a newer
+        move replaced it while it waited. The move runs in its own task, so a
+        caller giving up doesn't cancel it for the requests folded into it.
+        """
+        queued = self._queued_move
+        if queued is not None:
+            queued.name, queued.operation = name, operation
+            queued.superseded += 1
+            self.stats.superseded += 1
+        else:
+            queued = self._queued_move = _QueuedMove(name, operation, time.monotonic())
+            queued.task = asyncio.get_running_loop().create_task(self._async_run_move(queued))
+        position = queued.superseded
+        if queued.task is not None:
+            await asyncio.shield(queued.task)
+        return queued.superseded == position
+
+    async def _async_run_move(self, queued: _QueuedMove) -> None:
+        """Run the queued move once it reaches the front; from then on it can't be replaced."""
+        async with self._lock:
+            if self._queued_move is queued:
+                self._queued_move = None
+            try:
+                await self._async_timed(queued.name, queued.operation, queued.queued_at, queued.superseded)
+            finally:
+                self.last_move = self.timings[-1]
+
+    async def _async_timed[T](
+        self,
+        name: str,
+        operation: Callable[[], Awaitable[T]],
+        queued_at: float,
+        superseded: int = 0,
+    ) -> T:
+        """Run ``operation`` and record how long it waited and took."""
+        started = time.monotonic()
+        ok = False
+        try:
+            result = await operation()
+            ok = True
+        finally:
+            execution = time.monotonic() - started
+            self.stats.operations += 1
+            self.stats.total_wait += started - queued_at
+            self.stats.total_execution += execution
+            timing = RunChickenCommandTiming(name, started - queued_at, execution, superseded=superseded, ok=ok)
+            self.timings.append(timing)
+            self.latest[name] = timing
+        return result
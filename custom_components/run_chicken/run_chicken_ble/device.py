@@ -2,26 +2,59 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
+import time
+from collections import deque
 from typing import TYPE_CHECKING
 
-from bleak_retry_connector import (
-    BleakClientWithServiceCache,
-    establish_connection,
-    retry_bluetooth_connection_error,
+from .commands import RunChickenCommandQueue
+from .exceptions import RunChickenCharacteristicError, RunChickenShutdownError
+from .models import (
+    RunChickenConnectionState,
+    RunChickenConnectionStats,
+    RunChickenDeviceData,
+    RunChickenGattHandles,
 )
-from homeassistant.helpers.update_coordinator import UpdateFailed
-
-from .models import RunChickenDeviceData
 from .protocol import READ_CHAR_UUID, WRITE_CHAR_UUID, RunChickenProtocol
+from .trace import NULL_SPAN
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Awaitable, Callable
+    from contextlib import AbstractContextManager
+
+    from bleak import BleakClient, BleakGATTCharacteristic, BLEDevice
 
-    from bleak import BleakClient, BLEDevice
+    from .models import RunChickenAdvertisement, RunChickenStatusFrame
+    from .trace import RunChickenTracer
 
 _LOGGER = logging.getLogger(__name__)
 
+#: Raw frames kept in memory per door for diagnostics.
+FRAME_LOG_SIZE = 64
+
+
+def _retry_on_connection_error[**P, T](func: Callable[P, Awaitable[T]]) -> Callable[P, Awaitable[T]]:
+    """
+    Apply ``bleak_retry_connector.retry_bluetooth_connection_error`` to ``func``.
+
+    The library (and with it Bleak) is only imported on the first call, so
+    importing this module doesn't load the BLE stack.
+    """
+    retrying: Callable[P, Awaitable[T]] | None = None
+
+    @functools.wraps(func)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+        nonlocal retrying
+        if retrying is None:
+            from bleak_retry_connector import retry_bluetooth_connection_error  # noqa: PLC0415
+
+            retrying = retry_bluetooth_connection_error()(func)
+        return await retrying(*args, **kwargs)
+
+    return wrapper
+
 
 class RunChickenDevice:
     """Representation of a Run-Chicken BLE device."""
@@ -41,6 +74,12 @@ class RunChickenDevice:
         # address is stable but the object's adapter/path details go stale.
         self.ble_device: BLEDevice = ble_device
         self._client: BleakClient | None = client
+        # Where the connection is in its lifecycle, and the setup in flight (if
+        # any) that every caller needing a connection meanwhile awaits.
+        self.connection_state = (
+            RunChickenConnectionState.READY if client is not None else RunChickenConnectionState.DISCONNECTED
+        )
+        self._connect_task: asyncio.Task[BleakClient] | None = None
         # Stored so notifications can be re-subscribed on every reconnect.
         self._notification_callback: Callable | None = None
         # Invoked on an unexpected disconnect so the owner can reconnect (which
@@ -52,6 +91,38 @@ class RunChickenDevice:
         # Optional debug hook invoked as (direction, payload) for every raw
         # message exchanged with the door when set ("RX" received, "TX" sent).
         self.raw_recorder: Callable[[str, bytes | bytearray], None] | None = None
+        # The most recent frames as (monotonic time, direction, payload), always
+        # on so they are already there when something goes wrong.
+        self.frame_log: deque[tuple[float, str, bytes]] = deque(maxlen=FRAME_LOG_SIZE)
+        # Latest fully decoded status frame (device clock and all), from a read
+        # or a notification.
+        self.status_frame: RunChickenStatusFrame | None = None
+        # The snapshot decoded from ``status_frame``, returned again for a repeat.
+        self._snapshot: RunChickenDeviceData | None = None
+        # Latest decoded manufacturer data, refreshed by the owner from adverts.
+        self.advertisement: RunChickenAdvertisement | None = None
+        # Lease mode: when set, the link is released after this many idle seconds
+        # and re-established on demand. ``None`` holds the connection forever.
+        self.idle_timeout: float | None = None
+        self._idle_timer: asyncio.TimerHandle | None = None
+        self._release_task: asyncio.Task[None] | None = None
+        # True while the link is down because we released it, not because it dropped.
+        self.idle_released = False
+        self.connection_stats = RunChickenConnectionStats()
+        # Opt-in phase timings (connect, subscribe, hello, read, write); may be
+        # shared with other doors. ``None`` (the default) records nothing.
+        self.tracer: RunChickenTracer | None = None
+        # Every poll and command goes through here, one GATT operation at a time.
+        self.command_queue = RunChickenCommandQueue()
+        # Characteristic handles remembered across connections (and, through the
+        # owner's storage, restarts), so each connect resolves them by handle.
+        # Only a failed handle lookup invalidates them; the owner is told about
+        # every change through ``gatt_cache_callback`` so it can persist it.
+        self.gatt_handles: RunChickenGattHandles | None = None
+        self.gatt_cache_callback: Callable[[RunChickenGattHandles | None], None] | None = None
+        # Characteristics resolved for the current connection.
+        self._read_char: BleakGATTCharacteristic | None = None
+        self._write_char: BleakGATTCharacteristic | None = None
 
         # Pick the command-frame protocol from the advertised name (T-50 vs GIANT).
         self.protocol = RunChickenProtocol.for_advertised_name(ble_device.name)
@@ -75,56 +146,201 @@ class RunChickenDevice:
 
     # --- Connection management ---
 
+    @property
+    def is_connected(self) -> bool:
+        """Return whether a live connection to the door is currently held."""
+        return self._client is not None and self._client.is_connected
+
     async def async_get_client(self) -> BleakClient:
         """
         Return a live client, connecting or reconnecting on demand.
 
-        Reuses the current connection while it is healthy. Raises ``UpdateFailed``
-        if the device is shutting down or a connection cannot be established.
+        Reuses the current connection while it is healthy. Connection setup is
+        single-flight: a caller arriving while another is connecting waits for
+        that attempt (and shares its outcome) instead of opening a second link.
+        Raises ``RunChickenShutdownError`` if the device is shutting down, or
+        Bleak's error if a connection cannot be established.
         """
-        if self._client is not None and self._client.is_connected:
+        if self._connect_task is None and self._client is not None and self._client.is_connected:
+            if self._read_char is None:
+                self._resolve_characteristics(self._client)
             return self._client
 
-        if self._expected_disconnect:
-            msg = "Run-Chicken device is shutting down."
-            raise UpdateFailed(msg)
+        if self._connect_task is None:
+            if self._expected_disconnect:
+                msg = "Run-Chicken device is shutting down."
+                raise RunChickenShutdownError(msg)
+            self._connect_task = asyncio.get_running_loop().create_task(self._async_connect())
+        else:
+            self.connection_stats.shared_connects += 1
+        # Shielded so one waiter giving up doesn't abort the attempt for the rest.
+        return await asyncio.shield(self._connect_task)
+
+    async def _async_connect(self) -> BleakClient:
+        """Connect, subscribe and say hello: the one connection attempt in flight."""
+        # Set once the link is up; a failed attempt never held a slot.
+        connected_at: float | None = None
 
         def on_disconnect(disconnected_client: BleakClient) -> None:
+            if connected_at is not None:
+                hold = time.monotonic() - connected_at
+                self.connection_stats.last_slot_hold = hold
+                self.connection_stats.connected_time += hold
+            # A client we already let go of (idle release or teardown), or one
+            # from an attempt that never connected, is expected to disconnect;
+            # only a drop of the current client is unexpected.
+            if disconnected_client is not self._client:
+                _LOGGER.debug("Device %s disconnected", disconnected_client.address)
+                if self._client is None and self.connection_state is RunChickenConnectionState.CLOSING:
+                    self.connection_state = RunChickenConnectionState.DISCONNECTED
+                return
             _LOGGER.warning("Device %s disconnected unexpectedly", disconnected_client.address)
+            self.connection_stats.drops += 1
             self._client = None
+            self.connection_state = RunChickenConnectionState.DISCONNECTED
+            self._cancel_idle_timer()
             # Notifications die with the connection; ask the owner to reconnect.
             if not self._expected_disconnect and self.disconnect_callback is not None:
                 self.disconnect_callback()
 
         _LOGGER.debug("Getting BleakClient for Run-Chicken door: %s", self.ble_device.address)
-        client = await establish_connection(
+        self.connection_state = RunChickenConnectionState.CONNECTING
+        client: BleakClient | None = None
+        try:
+            started = time.monotonic()
+            with self._span("connect"):
+                client = await self._async_establish_connection(on_disconnect)
+            connected_at = time.monotonic()
+            self.connection_stats.connects += 1
+            self.connection_stats.last_connect_latency = connected_at - started
+            self.connection_stats.total_connect_latency += connected_at - started
+            self._client = client
+            self.idle_released = False
+            self.connection_state = RunChickenConnectionState.SUBSCRIBING
+            with self._span("resolve"):
+                self._resolve_characteristics(client)
+
+            # Re-subscribe notifications so push updates resume after a reconnect, and
+            # so we catch any state the door pushes in reply to the hello below.
+            with self._span("subscribe"):
+                await self._async_subscribe_notifications()
+
+            # The official GIANT app sends a session-init "hello" right after
+            # connecting; we do the same for every model, once per connection.
+            with self._span("hello"):
+                await self._async_send_command(self.protocol.session_init_packet(), client=client)
+        except BaseException:
+            # Don't leave a half set-up link behind for the next caller to reuse.
+            if client is not None and self._client is client:
+                self._client = None
+                self._release_task = asyncio.get_running_loop().create_task(client.disconnect())
+            if self.connection_state is not RunChickenConnectionState.CLOSING:
+                self.connection_state = RunChickenConnectionState.DISCONNECTED
+            raise
+        finally:
+            self._connect_task = None
+
+        self.connection_state = RunChickenConnectionState.READY
+        return client
+
+    async def _async_establish_connection(self, disconnected_callback: Callable[[BleakClient], None]) -> BleakClient:
+        """
+        Open a new connection to the door.
+
+        The only place a client is created, so a subclass can hand out a stand-in
+        (see ``dev/simulator.py``) and exercise everything above it without a door.
+        """
+        from bleak_retry_connector import BleakClientWithServiceCache, establish_connection  # noqa: PLC0415
+
+        return await establish_connection(
             BleakClientWithServiceCache,
             self.ble_device,
             self.ble_device.address,
-            disconnected_callback=on_disconnect,
+            disconnected_callback=disconnected_callback,
             # Re-fetch the freshest BLEDevice on each retry so a stale path
             # captured at setup doesn't doom the connection.
             ble_device_callback=lambda: self.ble_device,
         )
-        self._client = client
-
-        # Re-subscribe notifications so push updates resume after a reconnect, and
-        # so we catch any state the door pushes in reply to the hello below.
-        await self._async_subscribe_notifications()
-
-        # The official GIANT app sends a session-init "hello" right after
-        # connecting; we do the same for every model, once per connection.
-        await self._async_send_command(self.protocol.session_init_packet(), client=client)
-
-        return client
 
     async def async_disconnect(self) -> None:
         """Disconnect and suppress auto-reconnect; used during teardown."""
         self._expected_disconnect = True
+        self._cancel_idle_timer()
+        self.connection_state = RunChickenConnectionState.CLOSING
+        if self._connect_task is not None:
+            self._connect_task.cancel()
+        client = self._client
+        self._client = None
+        try:
+            if client is not None and client.is_connected:
+                await client.disconnect()
+        finally:
+            self.connection_state = RunChickenConnectionState.DISCONNECTED
+
+    def _resolve_characteristics(self, client: BleakClient) -> None:
+        """Resolve the read/write characteristics for ``client``, preferring cached handles."""
+        services = client.services
+        cached = self.gatt_handles
+        if cached is not None:
+            read_char = services.get_characteristic(cached.read)
+            write_char = services.get_characteristic(cached.write)
+            if (
+                read_char is not None
+                and read_char.uuid == READ_CHAR_UUID
+                and write_char is not None
+                and write_char.uuid == WRITE_CHAR_UUID
+            ):
+                self._read_char, self._write_char = read_char, write_char
+                return
+            _LOGGER.debug("Cached GATT handles for %s are stale; resolving by UUID", self.address)
+
+        self._read_char = services.get_characteristic(READ_CHAR_UUID)
+        self._write_char = services.get_characteristic(WRITE_CHAR_UUID)
+        resolved = None
+        if self._read_char is not None and self._write_char is not None:
+            resolved = RunChickenGattHandles(read=self._read_char.handle, write=self._write_char.handle)
+        if resolved != cached:
+            self.gatt_handles = resolved
+            if self.gatt_cache_callback is not None:
+                self.gatt_cache_callback(resolved)
+
+    def _span(self, phase: str) -> AbstractContextManager[object]:
+        """Return a span timing ``phase`` when tracing is on, else a shared no-op."""
+        if self.tracer is None:
+            return NULL_SPAN
+        return self.tracer.span(phase, self.address)
+
+    def _touch(self) -> None:
+        """Restart the idle countdown after the link was used (lease mode only)."""
+        if self.idle_timeout is None:
+            return
+        self._cancel_idle_timer()
+        self._idle_timer = asyncio.get_running_loop().call_later(self.idle_timeout, self._release_idle)
+
+    def _cancel_idle_timer(self) -> None:
+        """Stop any pending idle release."""
+        if self._idle_timer is not None:
+            self._idle_timer.cancel()
+            self._idle_timer = None
+
+    def _release_idle(self) -> None:
+        """Timer callback: give the connection slot back after sitting idle."""
+        self._idle_timer = None
         client = self._client
+        if client is None or not client.is_connected:
+            return
+        if self.command_queue.busy or self._connect_task is not None:
+            # Mid-operation: releasing now would drop the link under a read or
+            # write (and the retry would reconnect and send it again).
+            self._touch()
+            return
+        _LOGGER.debug("Releasing idle connection to Run-Chicken door %s", self.address)
+        # Drop our reference first so on_disconnect treats this as expected.
         self._client = None
-        if client is not None and client.is_connected:
-            await client.disconnect()
+        self.connection_state = RunChickenConnectionState.CLOSING
+        self.idle_released = True
+        self.connection_stats.idle_releases += 1
+        self._release_task = asyncio.get_running_loop().create_task(client.disconnect())
 
     # --- Push notifications ---
 
@@ -142,43 +358,86 @@ class RunChickenDevice:
         """Subscribe the stored notification callback on the current client, if any."""
         if self._notification_callback is None or self._client is None:
             return
-        read_char = self._client.services.get_characteristic(READ_CHAR_UUID)
-        if read_char is None:
+        if self._read_char is None:
             _LOGGER.warning("Read characteristic %s not found; cannot subscribe to notifications", READ_CHAR_UUID)
             return
-        await self._client.start_notify(read_char, self._notification_callback)
+        await self._client.start_notify(self._read_char, self._notification_callback)
         _LOGGER.debug("Subscribed to Run-Chicken notifications on %s", self._client.address)
 
     # --- Reading state ---
 
-    @retry_bluetooth_connection_error()
     async def poll_device(self) -> RunChickenDeviceData:
+        """
+        Read the door's state once any queued command has run, and return a fresh snapshot.
+
+        A poll queued behind a command reads over the connection the command
+        opened.
+        """
+        return await self.command_queue.async_run("poll", self._async_poll)
+
+    @_retry_on_connection_error
+    async def _async_poll(self) -> RunChickenDeviceData:
         """Connect to the device, read its raw state payload, and return a fresh snapshot."""
+        self._cancel_idle_timer()
         client = await self.async_get_client()
-        char = client.services.get_characteristic(READ_CHAR_UUID)
-        if char is None:
+        if self._read_char is None:
             msg = f"Read characteristic {READ_CHAR_UUID} not found on device."
-            raise UpdateFailed(msg)
-        payload = await client.read_gatt_char(char)
+            raise RunChickenCharacteristicError(msg)
+        with self._span("read"):
+            payload = await client.read_gatt_char(self._read_char)
+        self._touch()
         return self.data_from_bytes(payload)
 
     def data_from_bytes(self, payload: bytes | bytearray) -> RunChickenDeviceData:
-        """Build a fresh state snapshot from a raw device payload."""
-        _LOGGER.debug("Building state from bytes: %s", payload.hex())
+        """
+        Return the state snapshot for a raw device payload.
+
+        A payload identical to the previous one isn't decoded again; the
+        previous (interned) snapshot is returned as is.
+        """
+        self._log_frame("RX", payload)
+        if self._snapshot is not None and self.status_frame is not None and payload == self.status_frame.raw:
+            return self._snapshot
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Building state from bytes: %s", payload.hex())
+        self.status_frame = self.protocol.parse_status_frame(payload)
+        self._snapshot = RunChickenDeviceData.from_status_frame(self.status_frame)
+        return self._snapshot
+
+    def _log_frame(self, direction: str, payload: bytes | bytearray) -> None:
+        """Keep a raw frame in the in-memory log, and hand it to the recorder if one is set."""
+        self.frame_log.append((time.monotonic(), direction, bytes(payload)))
         if self.raw_recorder is not None:
-            self.raw_recorder("RX", payload)
-        return RunChickenDeviceData(door_state=self.protocol.parse_door_state(payload))
+            self.raw_recorder(direction, payload)
 
     # --- Door commands ---
 
-    @retry_bluetooth_connection_error()
-    async def async_open(self) -> None:
-        """Open the Run-Chicken door."""
+    async def async_open(self) -> bool:
+        """
+        Open the Run-Chicken door.
+
+        Replaces a close that is still queued; returns ``False`` if this request
+        was itself replaced by a newer open or close before it was sent.
+        """
+        return await self.command_queue.async_move("open", self._async_open)
+
+    async def async_close(self) -> bool:
+        """
+        Close the Run-Chicken door.
+
+        Replaces an open that is still queued; returns ``False`` if this request
+        was itself replaced by a newer open or close before it was sent.
+        """
+        return await self.command_queue.async_move("close", self._async_close)
+
+    @_retry_on_connection_error
+    async def _async_open(self) -> None:
+        """Write the open command."""
         await self._async_send_command(self.protocol.open_packet())
 
-    @retry_bluetooth_connection_error()
-    async def async_close(self) -> None:
-        """Close the Run-Chicken door."""
+    @_retry_on_connection_error
+    async def _async_close(self) -> None:
+        """Write the close command."""
         await self._async_send_command(self.protocol.close_packet())
 
     async def _async_send_command(self, packet: bytes, client: BleakClient | None = None) -> None:
@@ -189,8 +448,10 @@ class RunChickenDevice:
         supplied — as it is for the session-init "hello", which is sent from
         within the connection setup itself.
         """
+        self._cancel_idle_timer()
         if client is None:
             client = await self.async_get_client()
-        if self.raw_recorder is not None:
-            self.raw_recorder("TX", packet)
-        await client.write_gatt_char(WRITE_CHAR_UUID, packet)
+        self._log_frame("TX", packet)
+        with self._span("write"):
+            await client.write_gatt_char(self._write_char or WRITE_CHAR_UUID, packet)
+        self._touch()
@@ -0,0 +1,15 @@
+"""Exceptions raised by the Run-Chicken BLE package."""
+
+from __future__ import annotations
+
+
+class RunChickenError(Exception):
+    """Base class for every error this package raises itself (Bleak's own errors pass through)."""
+
+
+class RunChickenShutdownError(RunChickenError):
+    """The device is being torn down and won't connect again."""
+
+
+class RunChickenCharacteristicError(RunChickenError):
+    """A characteristic the protocol needs is missing from the connected door."""
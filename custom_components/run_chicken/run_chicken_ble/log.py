@@ -0,0 +1,68 @@
+"""Logging helpers for hot paths: deferred payload formatting and per-door sampling."""
+
+from __future__ import annotations
+
+import dataclasses
+import logging
+import time
+
+
+class LazyHex:
+    """A payload that is only hex-formatted if a log record using it is actually emitted."""
+
+    __slots__ = ("_payload",)
+
+    def __init__(self, payload: bytes | bytearray) -> None:
+        """Wrap ``payload`` without copying or formatting it."""
+        self._payload = payload
+
+    def __str__(self) -> str:
+        """Return the payload as hex."""
+        return self._payload.hex()
+
+
+@dataclasses.dataclass(slots=True)
+class _Window:
+    """Records let through and dropped for one key in the current one-second window."""
+
+    started: float
+    emitted: int = 1
+    suppressed: int = 0
+
+
+class LogSampler:
+    """
+    Let at most ``per_second`` records a second through for each key (a door's address).
+
+    For high-rate events (advertisements, notifications) that would otherwise
+    flood a debug log. The logger's level is checked first, so with that level
+    off a call costs one cached lookup and nothing is formatted.
+    """
+
+    def __init__(self, logger: logging.Logger, per_second: int, level: int = logging.DEBUG) -> None:
+        """Sample records at ``level`` on ``logger``."""
+        self._logger = logger
+        self._per_second = per_second
+        self._level = level
+        self._windows: dict[str, _Window] = {}
+
+    def sample(self, key: str) -> int | None:
+        """
+        Decide whether to log an event for ``key``.
+
+        Returns ``None`` to drop it, otherwise how many of ``key``'s events
+        were dropped since the last one logged (so the record can say so).
+        """
+        if not self._logger.isEnabledFor(self._level):
+            return None
+        now = time.monotonic()
+        window = self._windows.get(key)
+        if window is None or now - window.started >= 1:
+            self._windows[key] = _Window(now)
+            return window.suppressed if window is not None else 0
+        if window.emitted < self._per_second:
+            window.emitted += 1
+            suppressed, window.suppressed = window.suppressed, 0
+            return suppressed
+        window.suppressed += 1
+        return None
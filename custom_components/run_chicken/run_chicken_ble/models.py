@@ -4,6 +4,10 @@ from __future__ import annotations
 
 import dataclasses
 from enum import Enum
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import datetime as dt
 
 
 class RunChickenDoorState(Enum):
@@ -14,14 +18,162 @@ class RunChickenDoorState(Enum):
     CLOSED = 2
 
 
-@dataclasses.dataclass(frozen=True)
+class RunChickenConnectionState(Enum):
+    """Where a door's connection is in its lifecycle; see ``RunChickenDevice.async_get_client``."""
+
+    #: No link; the next poll or command connects.
+    DISCONNECTED = "disconnected"
+    #: ``establish_connection`` in flight.
+    CONNECTING = "connecting"
+    #: Linked; subscribing to notifications and sending the session hello.
+    SUBSCRIBING = "subscribing"
+    #: Set up and usable.
+    READY = "ready"
+    #: Being torn down, on purpose (idle release or unload).
+    CLOSING = "closing"
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class RunChickenStatusFrame:
+    """
+    Every field of one status frame read from, or pushed by, the door.
+
+    See ``RunChickenProtocol.parse_status_frame`` for the byte layout. Only the
+    door state is documented; the other meanings are inferred from captures of
+    the official app and are marked as such. A payload too short for the full
+    layout decodes with just ``door_state`` (and ``raw``) set.
+    """
+
+    door_state: RunChickenDoorState
+    #: 0x48 in reply to a write, 0xB5 when pushed after the door stops moving.
+    frame_type: int | None = None
+    #: The door's own clock, set from the timestamp in our command frames.
+    device_time: dt.datetime | None = None
+    #: Whole-degree coordinates the app configured (inferred), presumably for
+    #: the sunrise/sunset schedule.
+    latitude: int | None = None
+    longitude: int | None = None
+    #: Unscaled battery reading (inferred: it sags while the motor runs).
+    battery_raw: int | None = None
+    #: Whether the motor is running, i.e. the door is moving.
+    motor_running: bool | None = None
+    #: The undecoded payload, including the bytes that never varied in captures.
+    raw: bytes = b""
+
+
+# Snapshots handed out by ``RunChickenDeviceData.from_status_frame``, one per
+# distinct state. A door only ever cycles through a handful of states, so this
+# stays small; it is cleared if it ever reaches the limit.
+_INTERNED_SNAPSHOTS: dict[tuple[object, ...], RunChickenDeviceData] = {}
+_INTERNED_SNAPSHOTS_LIMIT = 1024
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
 class RunChickenDeviceData:
     """
     Immutable snapshot of a Run-Chicken door's observed state.
 
-    This is the coordinator's data payload, rebuilt on every update and pushed to
-    entities. It holds only values that change over the device's life; static
-    identity (model, manufacturer, address) lives on ``RunChickenDevice``.
+    This is the coordinator's data payload, pushed to entities on every change.
+    Snapshots built from status frames are interned, so an unchanged state is
+    the very same object and can be compared with ``is``. It holds only values
+    that change over the device's life; static identity (model, manufacturer,
+    address) lives on ``RunChickenDevice``, as does the latest full
+    ``RunChickenStatusFrame`` with the per-frame details (device clock, frame
+    type) left out here.
     """
 
     door_state: RunChickenDoorState = RunChickenDoorState.UNKNOWN
+    motor_running: bool | None = None
+    battery_raw: int | None = None
+    latitude: int | None = None
+    longitude: int | None = None
+
+    @classmethod
+    def from_status_frame(cls, frame: RunChickenStatusFrame) -> RunChickenDeviceData:
+        """Return the shared snapshot for the state in a decoded status frame."""
+        key = (frame.door_state, frame.motor_running, frame.battery_raw, frame.latitude, frame.longitude)
+        snapshot = _INTERNED_SNAPSHOTS.get(key)
+        if snapshot is None:
+            if len(_INTERNED_SNAPSHOTS) >= _INTERNED_SNAPSHOTS_LIMIT:
+                _INTERNED_SNAPSHOTS.clear()
+            snapshot = _INTERNED_SNAPSHOTS[key] = cls(*key)
+        return snapshot
+
+
+@dataclasses.dataclass(frozen=True)
+class RunChickenAdvertisement:
+    """
+    Decoded Run-Chicken manufacturer data (company ID 43521) from an advertisement.
+
+    The payload is four status bytes followed by the door's MAC address. Every
+    capture so far shows the status bytes as zero, so the door state is *not*
+    advertised; an advertisement only tells us the door is present and in range.
+    """
+
+    status: bytes
+    mac: str
+
+
+@dataclasses.dataclass
+class RunChickenConnectionStats:
+    """
+    Running connection metrics for one door, updated in place by the device.
+
+    Times are in seconds. A connection "holds a slot" on its adapter or proxy
+    from the moment it is established until it drops or is released.
+    """
+
+    #: Connections established.
+    connects: int = 0
+    #: Time the most recent ``establish_connection`` took.
+    last_connect_latency: float | None = None
+    #: Sum of all connect latencies (divide by ``connects`` for the mean).
+    total_connect_latency: float = 0.0
+    #: How long the most recently closed connection was held.
+    last_slot_hold: float | None = None
+    #: Total time spent connected across every closed connection.
+    connected_time: float = 0.0
+    #: Connections released deliberately after sitting idle.
+    idle_releases: int = 0
+    #: Connections that dropped unexpectedly (each one triggers a reconnect).
+    drops: int = 0
+    #: Callers that needed a connection while one was already being set up,
+    #: and waited for it instead of opening their own.
+    shared_connects: int = 0
+
+
+@dataclasses.dataclass(frozen=True)
+class RunChickenGattHandles:
+    """ATT handles of the door's read and write characteristics, cached across connections."""
+
+    read: int
+    write: int
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class RunChickenCommandTiming:
+    """How long one queued GATT operation waited for its turn, and then took."""
+
+    #: Operation name: "open", "close" or "poll".
+    name: str
+    #: Seconds between being queued and starting.
+    wait: float
+    #: Seconds the operation itself ran, connecting (and retrying) included.
+    execution: float
+    #: Pending open/close requests this one replaced before it started.
+    superseded: int = 0
+    #: Whether it finished without raising.
+    ok: bool = True
+
+
+@dataclasses.dataclass
+class RunChickenCommandStats:
+    """Running totals for a door's command queue; see ``RunChickenCommandTiming`` for single operations."""
+
+    #: Operations run through the queue.
+    operations: int = 0
+    #: Open/close requests dropped because a newer one replaced them while queued.
+    superseded: int = 0
+    #: Sum of all queue waits and execution times, in seconds.
+    total_wait: float = 0.0
+    total_execution: float = 0.0
@@ -5,7 +5,7 @@ Different door models speak slightly different command-frame formats. Each model
 is represented by a `RunChickenProtocol` subclass that knows how to build its own
 packets and decode the door's responses; the right protocol is chosen from the
 BLE advertised name. This module also owns the GATT characteristic identifiers
-the door exposes.
+the door exposes and the decoder for its advertised manufacturer data.
 """
 
 from __future__ import annotations
@@ -17,9 +17,8 @@ import struct
 from enum import IntEnum
 from typing import ClassVar
 
-import crc8
-
-from .models import RunChickenDoorState
+from .log import LazyHex
+from .models import RunChickenAdvertisement, RunChickenDoorState, RunChickenStatusFrame
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -30,6 +29,55 @@ READ_CHAR_UUID = "00000001-8e22-4541-9d4c-21edae82ed19"
 WRITE_SERVICE_UUID = "00000000-cc7a-482a-984a-7f2ed5b3e58f"
 WRITE_CHAR_UUID = "00000000-8e22-4541-9d4c-21edae82ed19"
 
+# CRC-8 over every command frame: polynomial 0x07, initial value 0, no
+# reflection or final XOR (the parameters of the ``crc8`` package we used to
+# depend on). Table-driven, one lookup per byte.
+_CRC8_POLYNOMIAL = 0x07
+
+
+def _crc8_table() -> bytes:
+    """Build the 256-entry lookup table for ``_CRC8_POLYNOMIAL``."""
+    table = bytearray(256)
+    for index in range(256):
+        crc = index
+        for _ in range(8):
+            crc = ((crc << 1) ^ _CRC8_POLYNOMIAL) & 0xFF if crc & 0x80 else (crc << 1) & 0xFF
+        table[index] = crc
+    return bytes(table)
+
+
+_CRC8_TABLE = _crc8_table()
+
+
+def crc8(data: bytes | bytearray | memoryview) -> int:
+    """Return the CRC-8 of ``data`` as used in Run-Chicken command frames."""
+    crc = 0
+    table = _CRC8_TABLE
+    for byte in data:
+        crc = table[crc ^ byte]
+    return crc
+
+
+# Manufacturer-data layout under company ID 43521: 4 status bytes + 6-byte MAC.
+_ADVERTISEMENT_LENGTH = 10
+_ADVERTISEMENT_STATUS_LENGTH = 4
+
+
+def parse_advertisement(manufacturer_data: bytes | bytearray) -> RunChickenAdvertisement | None:
+    """
+    Decode the manufacturer data a Run-Chicken door advertises.
+
+    Returns ``None`` if the payload doesn't have the expected length, e.g. when
+    a different device happens to reuse the company ID.
+    """
+    if len(manufacturer_data) != _ADVERTISEMENT_LENGTH:
+        return None
+    mac = manufacturer_data[_ADVERTISEMENT_STATUS_LENGTH:]
+    return RunChickenAdvertisement(
+        status=bytes(manufacturer_data[:_ADVERTISEMENT_STATUS_LENGTH]),
+        mac=":".join(f"{octet:02X}" for octet in mac),
+    )
+
 
 class RunChickenAction(IntEnum):
     """Door action encoded in a command frame (byte [21])."""
@@ -45,9 +93,31 @@ class RunChickenProtocol(abc.ABC):
     #: Human-readable model name, surfaced in the device registry.
     model: ClassVar[str]
 
+    #: Precompiled layout of a command frame's body (everything but the CRC).
+    frame: ClassVar[struct.Struct]
+
     #: Byte offset of the door-state field in a read-characteristic payload.
     door_state_offset: ClassVar[int] = 17
 
+    #: Layout of a full 20-byte status frame: [0] frame type, [1..4] device
+    #: clock (Unix time), [5..8] unknown, [9..10]/[11..12] latitude/longitude
+    #: (signed whole degrees), [13] battery, [14] unknown, [15] flags (0x20 =
+    #: motor running), [16] unknown, [17] door state, [18..19] unknown.
+    status_frame: ClassVar[struct.Struct] = struct.Struct("<BI4xhhBxBxBxx")
+
+    _DOOR_STATE: ClassVar[struct.Struct] = struct.Struct("<B")
+    _DOOR_STATES: ClassVar[dict[int, RunChickenDoorState]] = {
+        0: RunChickenDoorState.OPEN,
+        1: RunChickenDoorState.CLOSED,
+    }
+    _MOTOR_RUNNING_FLAG: ClassVar[int] = 0x20
+
+    def __init__(self) -> None:
+        """Initialise the protocol with its reusable frame buffer."""
+        # Body plus the trailing CRC byte; every frame is packed in place here.
+        self._buffer = bytearray(self.frame.size + 1)
+        self._body = memoryview(self._buffer)[: self.frame.size]
+
     @classmethod
     def for_advertised_name(cls, name: str | None) -> RunChickenProtocol:
         """
@@ -60,6 +130,14 @@ class RunChickenProtocol(abc.ABC):
             return GiantProtocol()
         return T50Protocol()
 
+    @classmethod
+    def for_model(cls, model: str) -> RunChickenProtocol | None:
+        """Return the protocol for a previously detected ``model``, if it is still known."""
+        for protocol in cls.__subclasses__():
+            if protocol.model == model:
+                return protocol()
+        return None
+
     def open_packet(self, packet_time: dt.datetime | None = None) -> bytes:
         """Create a packet for opening the door."""
         return self._build(RunChickenAction.OPEN, self._resolve_time(packet_time))
@@ -79,12 +157,35 @@ class RunChickenProtocol(abc.ABC):
         The state is a single byte at ``door_state_offset`` (0 = open,
         1 = closed); a short or unrecognised payload reads as ``UNKNOWN``.
         """
-        _LOGGER.debug("Parsing payload: %s", payload.hex())
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Parsing payload: %s", payload.hex())
         if len(payload) <= self.door_state_offset:
-            _LOGGER.warning("Payload too short to contain door state: %s", payload.hex())
+            _LOGGER.warning("Payload too short to contain door state: %s", LazyHex(payload))
             return RunChickenDoorState.UNKNOWN
-        return {0: RunChickenDoorState.OPEN, 1: RunChickenDoorState.CLOSED}.get(
-            payload[self.door_state_offset], RunChickenDoorState.UNKNOWN
+        (door_state,) = self._DOOR_STATE.unpack_from(memoryview(payload), self.door_state_offset)
+        return self._DOOR_STATES.get(door_state, RunChickenDoorState.UNKNOWN)
+
+    def parse_status_frame(self, payload: bytes | bytearray) -> RunChickenStatusFrame:
+        """
+        Decode every field of a read-characteristic payload in one pass.
+
+        A payload shorter than ``status_frame`` still yields its door state (see
+        ``parse_door_state``); the remaining fields are then left unset.
+        """
+        if len(payload) < self.status_frame.size:
+            return RunChickenStatusFrame(door_state=self.parse_door_state(payload), raw=bytes(payload))
+        frame_type, unix_time, latitude, longitude, battery, flags, door_state = self.status_frame.unpack_from(
+            memoryview(payload)
+        )
+        return RunChickenStatusFrame(
+            door_state=self._DOOR_STATES.get(door_state, RunChickenDoorState.UNKNOWN),
+            frame_type=frame_type,
+            device_time=dt.datetime.fromtimestamp(unix_time, dt.UTC),
+            latitude=latitude,
+            longitude=longitude,
+            battery_raw=battery,
+            motor_running=bool(flags & self._MOTOR_RUNNING_FLAG),
+            raw=bytes(payload),
         )
 
     @staticmethod
@@ -92,17 +193,16 @@ class RunChickenProtocol(abc.ABC):
         """Default a missing timestamp to the current UTC time."""
         return packet_time if packet_time is not None else dt.datetime.now(dt.UTC)
 
-    @staticmethod
-    def _append_crc(packet: bytes) -> bytes:
-        """Return ``packet`` with its trailing CRC-8 byte appended."""
-        crc = crc8.crc8()
-        crc.update(packet)
-        return packet + struct.pack("<B", crc.digest()[0])
+    def _build(self, action: RunChickenAction, packet_time: dt.datetime) -> bytes:
+        """Pack the frame for ``action`` into the reusable buffer, append its CRC, and return a copy."""
+        self.frame.pack_into(self._buffer, 0, *self._fields(action, packet_time))
+        self._buffer[-1] = crc8(self._body)
+        return bytes(self._buffer)
 
     @abc.abstractmethod
-    def _build(self, action: RunChickenAction, packet_time: dt.datetime) -> bytes:
+    def _fields(self, action: RunChickenAction, packet_time: dt.datetime) -> tuple[int, ...]:
         """
-        Build the raw command frame for ``action`` (including its CRC).
+        Return the values to pack into ``frame`` for ``action``.
 
         The frame is stamped with ``packet_time``, and byte [0] is 0x01 for the
         session-init/status frame (``action`` is ``STATUS``) or 0x00 for a door
@@ -120,28 +220,22 @@ class T50Protocol(RunChickenProtocol):
 
     model = "T-50"
 
-    def _build(self, action: RunChickenAction, packet_time: dt.datetime) -> bytes:
-        # Byte [0] is 0x01 for the session-init/status frame, 0x00 for a command.
-        packet = bytes([0x01 if action is RunChickenAction.STATUS else 0x00])
-        unix_time = int(packet_time.timestamp())
-
-        # Unix timestamp
-        packet += struct.pack("<I", unix_time)
-        packet += struct.pack("<I", unix_time)  # Repeat the timestamp for some reason
-        packet += struct.pack("<6x")
-
-        # Add the UTC hour
-        packet += struct.pack("<B", packet_time.hour)
-        packet += struct.pack("<B", packet_time.minute)
-        packet += struct.pack("<B", packet_time.hour)
-        packet += struct.pack("<B", packet_time.minute)
-        packet += struct.pack("<2x")
+    # [0] session flag, [1..8] Unix time twice (for some reason), 6 pad bytes,
+    # [15..18] UTC hour/minute twice, 2 pad bytes, [21] action, 9 pad bytes.
+    frame = struct.Struct("<BII6xBBBB2xB9x")
 
-        # Open or close the door
-        packet += struct.pack("<B", action)
-        packet += struct.pack("<9x")
-
-        return self._append_crc(packet)
+    def _fields(self, action: RunChickenAction, packet_time: dt.datetime) -> tuple[int, ...]:
+        unix_time = int(packet_time.timestamp())
+        return (
+            0x01 if action is RunChickenAction.STATUS else 0x00,
+            unix_time,
+            unix_time,
+            packet_time.hour,
+            packet_time.minute,
+            packet_time.hour,
+            packet_time.minute,
+            action,
+        )
 
 
 class GiantProtocol(RunChickenProtocol):
@@ -155,12 +249,12 @@ class GiantProtocol(RunChickenProtocol):
 
     model = "GIANT"
 
-    def _build(self, action: RunChickenAction, packet_time: dt.datetime) -> bytes:
-        # Byte [0] is 0x01 for the session-init/status frame, 0x00 for a command.
-        packet = bytes([0x01 if action is RunChickenAction.STATUS else 0x00])
-        packet += struct.pack("<I", int(packet_time.timestamp()))
-        packet += struct.pack("<16x")
-        packet += struct.pack("<B", action)
-        packet += struct.pack("<9x")
-
-        return self._append_crc(packet)
+    # [0] session flag, [1..4] Unix time, 16 zero bytes, [21] action, 9 pad bytes.
+    frame = struct.Struct("<BI16xB9x")
+
+    def _fields(self, action: RunChickenAction, packet_time: dt.datetime) -> tuple[int, ...]:
+        return (
+            0x01 if action is RunChickenAction.STATUS else 0x00,
+            int(packet_time.timestamp()),
+            action,
+        )
@@ -0,0 +1,79 @@
+"""On-disk formats of raw-byte recordings, shared by the recorder and the dev tools."""
+
+from __future__ import annotations
+
+import base64
+import datetime as dt
+import struct
+from enum import StrEnum
+from typing import IO, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+#: First bytes of every binary recording, so tools can tell the formats apart.
+BINARY_MAGIC = b"RCREC\x01"
+#: Binary record header: Unix time (float64), direction (0 = RX, 1 = TX), payload length.
+BINARY_RECORD = struct.Struct("<dBH")
+BINARY_DIRECTIONS = {"RX": 0, "TX": 1}
+_BINARY_DIRECTION_NAMES = {value: key for key, value in BINARY_DIRECTIONS.items()}
+
+#: ``(unix time, direction, payload)``; direction is ``"RX"`` (received) or ``"TX"`` (sent).
+type Message = tuple[float, str, bytes]
+
+
+class RecordFormat(StrEnum):
+    """On-disk format of a raw-byte recording."""
+
+    #: One ``<ISO-8601 UTC timestamp> <RX|TX> <base64 payload>`` line per message.
+    TEXT = "text"
+    #: ``BINARY_MAGIC``, then a ``BINARY_RECORD`` header plus raw payload per message.
+    BINARY = "binary"
+
+
+def encode_messages(record_format: RecordFormat, messages: Iterable[Message]) -> bytes:
+    """
+    Serialise messages in ``record_format``.
+
+    A binary file additionally starts with ``BINARY_MAGIC``, which is not included.
+    """
+    if record_format is RecordFormat.BINARY:
+        return b"".join(
+            BINARY_RECORD.pack(timestamp, BINARY_DIRECTIONS.get(direction, 0), len(payload)) + payload
+            for timestamp, direction, payload in messages
+        )
+    return "".join(
+        f"{dt.datetime.fromtimestamp(timestamp, dt.UTC).isoformat()} {direction} "
+        f"{base64.b64encode(payload).decode('ascii')}\n"
+        for timestamp, direction, payload in messages
+    ).encode("ascii")
+
+
+def decode_text(file: IO[bytes], on_malformed: Callable[[int, str], None] | None = None) -> Iterator[Message]:
+    """
+    Yield the messages of a text recording, streaming.
+
+    A line that doesn't parse is skipped and handed to ``on_malformed`` as
+    ``(line number, line)``.
+    """
+    for number, line in enumerate(file, 1):
+        if not line.strip():
+            continue
+        try:
+            timestamp, direction, payload = line.decode("ascii").split()
+            message = dt.datetime.fromisoformat(timestamp).timestamp(), direction, base64.b64decode(payload)
+        except ValueError:
+            if on_malformed is not None:
+                on_malformed(number, line.decode("ascii", "replace").rstrip())
+            continue
+        yield message
+
+
+def decode_binary(file: IO[bytes]) -> Iterator[Message]:
+    """Yield the messages of a binary recording, magic included, streaming; a truncated last record is dropped."""
+    file.read(len(BINARY_MAGIC))
+    while header := file.read(BINARY_RECORD.size):
+        if len(header) < BINARY_RECORD.size:
+            return
+        timestamp, direction, length = BINARY_RECORD.unpack(header)
+        yield timestamp, _BINARY_DIRECTION_NAMES.get(direction, "RX"), file.read(length)
@@ -0,0 +1,95 @@
+"""Opt-in phase tracing for Run-Chicken BLE operations, exported as Chrome trace events."""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Any, Self
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+#: Spans kept in memory; the oldest are dropped first.
+TRACE_BUFFER_SIZE = 4096
+
+#: What a device uses in place of a span while tracing is off: no clock reads,
+#: no allocation, one shared object.
+NULL_SPAN = contextlib.nullcontext()
+
+
+class RunChickenSpan:
+    """One timed phase; records itself into its tracer when the ``with`` block exits."""
+
+    __slots__ = ("_door", "_name", "_started", "_tracer")
+
+    def __init__(self, tracer: RunChickenTracer, name: str, door: str) -> None:
+        """Prepare a span for ``name`` on ``door``; timing starts on enter."""
+        self._tracer = tracer
+        self._name = name
+        self._door = door
+        self._started = 0
+
+    def __enter__(self) -> Self:
+        """Start timing."""
+        self._started = time.perf_counter_ns()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Stop timing and record the span, noting the error if the phase raised."""
+        self._tracer.events.append(
+            (self._name, self._door, self._started, time.perf_counter_ns() - self._started, exc_type)
+        )
+
+
+class RunChickenTracer:
+    """
+    Bounded buffer of timed phases (connect, subscribe, hello, read, write).
+
+    One tracer can be shared by any number of doors; each door becomes a track
+    of its own, so exporting puts the whole fleet on one timeline. Open the
+    export in ``chrome://tracing`` or https://ui.perfetto.dev.
+    """
+
+    def __init__(self, size: int = TRACE_BUFFER_SIZE) -> None:
+        """Create an empty tracer keeping at most ``size`` spans."""
+        # (name, door, start ns, duration ns, exception type or None)
+        self.events: deque[tuple[str, str, int, int, type[BaseException] | None]] = deque(maxlen=size)
+
+    def span(self, name: str, door: str) -> RunChickenSpan:
+        """Return a context manager timing phase ``name`` of ``door``."""
+        return RunChickenSpan(self, name, door)
+
+    def clear(self) -> None:
+        """Drop every recorded span."""
+        self.events.clear()
+
+    def export(self) -> dict[str, Any]:
+        """Return the buffered spans in Chrome trace-event format, one thread per door."""
+        pid = os.getpid()
+        threads: dict[str, int] = {}
+        trace_events: list[dict[str, Any]] = []
+        for name, door, started, duration, exc_type in self.events:
+            tid = threads.get(door)
+            if tid is None:
+                tid = threads[door] = len(threads) + 1
+                trace_events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": door}})
+            event: dict[str, Any] = {
+                "name": name,
+                "cat": "ble",
+                "ph": "X",
+                "pid": pid,
+                "tid": tid,
+                "ts": started / 1000,
+                "dur": duration / 1000,
+            }
+            if exc_type is not None:
+                event["args"] = {"error": exc_type.__name__}
+            trace_events.append(event)
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
@@ -0,0 +1,273 @@
+"""Refresh and update scheduling for Run-Chicken doors."""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import logging
+from enum import StrEnum
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Coroutine
+
+    from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class RefreshTrigger(StrEnum):
+    """What asked for a refresh."""
+
+    ADVERTISEMENT = "advertisement"
+    RECONNECT = "reconnect"
+
+
+@dataclasses.dataclass
+class RefreshSchedulerStats:
+    """Counters describing how refresh triggers were handled."""
+
+    #: Triggers received, from any source.
+    triggers: int = 0
+    #: Refreshes actually run against the door.
+    refreshes: int = 0
+    #: Triggers folded into a refresh that was already scheduled or in flight.
+    merged: int = 0
+    #: Advertisement triggers discarded because a refresh was already in flight.
+    dropped: int = 0
+
+
+class RefreshScheduler:
+    """
+    Coalesce refresh triggers for one door into at most one refresh in flight.
+
+    Advertisement and reconnect triggers go through ``async_trigger``: the first
+    one starts a refresh straight away, and later ones within ``debounce``
+    seconds of the last refresh finishing are merged into a single deferred
+    refresh. Every fetch (including the coordinator's own interval polls) runs
+    through ``async_run``, which shares an in-flight fetch with any caller that
+    arrives while it is running, so the door never sees overlapping reads.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        refresh: Callable[[], Coroutine[Any, Any, None]],
+        debounce: float,
+    ) -> None:
+        """Initialise a scheduler that calls ``refresh`` when triggered."""
+        self._hass = hass
+        self._refresh = refresh
+        self.debounce = debounce
+        self.stats = RefreshSchedulerStats()
+        self._timer: asyncio.TimerHandle | None = None
+        self._in_flight: asyncio.Future[Any] | None = None
+        # Set when a reconnect arrives mid-refresh; run once more afterwards.
+        self._follow_up = False
+        self._last_finished: float | None = None
+
+    @property
+    def in_flight(self) -> bool:
+        """Return whether a fetch is currently running."""
+        return self._in_flight is not None
+
+    @callback
+    def async_trigger(self, trigger: RefreshTrigger) -> None:
+        """Ask for a refresh; cheap enough to call on every advertisement."""
+        self.stats.triggers += 1
+        if self._timer is not None or self._follow_up:
+            self.stats.merged += 1
+            return
+        if self._in_flight is not None:
+            # The in-flight read is at least as fresh as anything an advert can
+            # tell us, but a reconnect may have raced it, so re-run for those.
+            if trigger is RefreshTrigger.ADVERTISEMENT:
+                self.stats.dropped += 1
+                return
+            self._follow_up = True
+            return
+        self._schedule()
+
+    async def async_run[T](self, fetch: Callable[[], Coroutine[Any, Any, T]]) -> T:
+        """Run ``fetch``, or share the result of the one already in flight."""
+        if self._in_flight is not None:
+            self.stats.merged += 1
+            return await asyncio.shield(self._in_flight)
+
+        self.stats.refreshes += 1
+        task = self._hass.async_create_task(fetch(), f"{DOMAIN}_fetch")
+        self._in_flight = task
+        task.add_done_callback(self._async_fetch_done)
+        return await asyncio.shield(task)
+
+    @callback
+    def async_cancel(self) -> None:
+        """Drop any deferred refresh; used when the entry unloads."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._follow_up = False
+
+    def _schedule(self) -> None:
+        """Start a refresh once the debounce window since the last one has passed."""
+        delay = 0.0
+        if self._last_finished is not None:
+            delay = max(0.0, self._last_finished + self.debounce - self._hass.loop.time())
+        self._timer = self._hass.loop.call_later(delay, self._async_fire)
+
+    @callback
+    def _async_fire(self) -> None:
+        """Timer callback: run the deferred refresh."""
+        self._timer = None
+        _LOGGER.debug("Running a triggered refresh")
+        self._hass.async_create_task(self._refresh(), f"{DOMAIN}_triggered_refresh")
+
+    @callback
+    def _async_fetch_done(self, task: asyncio.Future[Any]) -> None:
+        """Clear the in-flight fetch and run any follow-up a reconnect asked for."""
+        # Every waiter may have been cancelled; mark the outcome as retrieved.
+        if not task.cancelled():
+            task.exception()
+        self._in_flight = None
+        self._last_finished = self._hass.loop.time()
+        if self._follow_up:
+            self._follow_up = False
+            self._schedule()
+
+
+@dataclasses.dataclass
+class NotificationCoalescerStats:
+    """Counters describing how pushed updates were coalesced."""
+
+    #: Updates received from the door.
+    received: int = 0
+    #: Updates passed on to the listeners.
+    published: int = 0
+    #: Repeats of the current state, held in a window and folded into a later
+    #: publish (or dropped once stale) instead of going out themselves.
+    merged: int = 0
+
+
+class NotificationCoalescer[T]:
+    """
+    Collapse bursts of repeated pushed updates, never delaying a change.
+
+    ``current`` returns the state the listeners hold now, however it got there
+    (a poll may have moved it on since the last publish). An update that
+    differs from it goes out straight away, whenever it arrives. Every publish
+    opens a ``window``-second window; a repeat of the current state arriving
+    inside it is held, and however many repeats arrive, one is published when
+    the window closes (which opens a new window), unless the state has moved on
+    by then. Once a window passes with nothing held, the next update goes
+    straight through again. A ``window`` of 0 publishes every update
+    immediately. Updates are compared by identity, so they should be interned
+    (as ``RunChickenDeviceData`` snapshots are), and must not be ``None``.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        publish: Callable[[T], None],
+        current: Callable[[], T | None],
+        window: float,
+    ) -> None:
+        """Initialise a coalescer that hands updates to ``publish``."""
+        self._hass = hass
+        self._publish = publish
+        self._current = current
+        self.window = window
+        self.stats = NotificationCoalescerStats()
+        self._timer: asyncio.TimerHandle | None = None
+        self._pending: T | None = None
+
+    @callback
+    def async_submit(self, update: T) -> None:
+        """Publish ``update`` now if it is a change, else hold it until the current window closes."""
+        self.stats.received += 1
+        if self._timer is None or update is not self._current():
+            # A held repeat of the old state is superseded by the change.
+            if self._pending is not None:
+                self.stats.merged += 1
+                self._pending = None
+            self._async_publish(update)
+            return
+        if self._pending is not None:
+            self.stats.merged += 1
+        self._pending = update
+
+    @callback
+    def async_cancel(self) -> None:
+        """Drop any pending update; used when the entry unloads."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._pending = None
+
+    @callback
+    def _async_publish(self, update: T) -> None:
+        """Hand ``update`` on and open a new window."""
+        self.stats.published += 1
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self.window > 0:
+            self._timer = self._hass.loop.call_later(self.window, self._async_window_closed)
+        self._publish(update)
+
+    @callback
+    def _async_window_closed(self) -> None:
+        """Timer callback: publish the latest pending update, if it is still the current state."""
+        self._timer = None
+        update, self._pending = self._pending, None
+        if update is None:
+            return
+        if update is not self._current():
+            # Something else published a newer state meanwhile; the held
+            # repeat of the old one is stale.
+            self.stats.merged += 1
+            return
+        self._async_publish(update)
+
+
+class AdaptivePollInterval:
+    """
+    Pick each door's next poll interval from how healthy push updates are.
+
+    While the link is up and a notification arrived within the last
+    ``healthy_within`` seconds, a poll mostly re-reads state we were already
+    pushed, so the interval doubles after every poll up to ``maximum``. It falls
+    back to ``base`` as soon as notifications go quiet or the link drops, and to
+    ``minimum`` for the poll after a reconnect, when a missed transition is most
+    likely. ``healthy_within`` is kept short, independent of ``maximum``: the
+    reply to the session hello at every connect is a notification too, and on
+    its own it says nothing about whether the subscription is still alive.
+    """
+
+    def __init__(self, base: float, minimum: float, maximum: float, healthy_within: float) -> None:
+        """Initialise the scheduler at the ``base`` interval."""
+        self.base = base
+        self.minimum = minimum
+        self.maximum = maximum
+        self.healthy_within = healthy_within
+        self.seconds = base
+        self._reconnected = False
+
+    @callback
+    def async_note_reconnect(self) -> None:
+        """Tighten the next interval after the link dropped and came back."""
+        self._reconnected = True
+
+    def next_interval(self, *, connected: bool, notification_age: float | None) -> float:
+        """Return the interval to wait before the next poll, in seconds."""
+        if self._reconnected:
+            self._reconnected = False
+            self.seconds = self.minimum
+        elif connected and notification_age is not None and notification_age <= self.healthy_within:
+            self.seconds = min(max(self.seconds, self.base) * 2, self.maximum)
+        else:
+            self.seconds = self.base
+        return self.seconds
@@ -0,0 +1,134 @@
+"""Diagnostic sensor platform for run_chicken."""
+
+from __future__ import annotations
+
+import dataclasses
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.const import SIGNAL_STRENGTH_DECIBELS_MILLIWATT, EntityCategory, UnitOfTime
+from homeassistant.helpers.device_registry import CONNECTION_BLUETOOTH, DeviceInfo
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.entity_platform import AddEntitiesCallback
+    from homeassistant.helpers.typing import StateType
+
+    from . import RunChickenConfigEntry
+    from .coordinator import RunChickenCoordinator
+
+# The values are counters the device and coordinator already keep, so reading
+# them is free; they're sampled on this interval rather than pushed, since most
+# change without the door's state (and so the coordinator's data) changing.
+SCAN_INTERVAL = timedelta(seconds=60)
+PARALLEL_UPDATES = 0
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class RunChickenSensorEntityDescription(SensorEntityDescription):
+    """Describes a Run-Chicken diagnostic sensor."""
+
+    value_fn: Callable[[RunChickenCoordinator], StateType]
+
+
+def _poll_duration(coordinator: RunChickenCoordinator) -> float | None:
+    timing = coordinator.device.command_queue.latest.get("poll")
+    return timing.execution if timing is not None else None
+
+
+def _command_rtt(coordinator: RunChickenCoordinator) -> float | None:
+    timing = coordinator.device.command_queue.last_move
+    return timing.execution if timing is not None else None
+
+
+SENSOR_DESCRIPTIONS: tuple[RunChickenSensorEntityDescription, ...] = (
+    RunChickenSensorEntityDescription(
+        key="connect_latency",
+        translation_key="connect_latency",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=2,
+        value_fn=lambda coordinator: coordinator.device.connection_stats.last_connect_latency,
+    ),
+    RunChickenSensorEntityDescription(
+        key="poll_duration",
+        translation_key="poll_duration",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=2,
+        value_fn=_poll_duration,
+    ),
+    RunChickenSensorEntityDescription(
+        key="command_rtt",
+        translation_key="command_rtt",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=2,
+        value_fn=_command_rtt,
+    ),
+    RunChickenSensorEntityDescription(
+        key="reconnects",
+        translation_key="reconnects",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda coordinator: coordinator.device.connection_stats.drops,
+    ),
+    RunChickenSensorEntityDescription(
+        key="notification_rate",
+        translation_key="notification_rate",
+        native_unit_of_measurement="notifications/h",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coordinator: coordinator.notification_rate,
+    ),
+    RunChickenSensorEntityDescription(
+        key="rssi",
+        translation_key="rssi",
+        device_class=SensorDeviceClass.SIGNAL_STRENGTH,
+        native_unit_of_measurement=SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coordinator: coordinator.rssi,
+    ),
+)
+
+
+async def async_setup_entry(
+    _hass: HomeAssistant,
+    entry: RunChickenConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the Run-Chicken diagnostic sensors."""
+    coordinator = entry.runtime_data
+    async_add_entities(RunChickenSensorEntity(coordinator, description) for description in SENSOR_DESCRIPTIONS)
+
+
+class RunChickenSensorEntity(SensorEntity):
+    """A link-health metric for one door; disabled until a user enables it."""
+
+    entity_description: RunChickenSensorEntityDescription
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(self, coordinator: RunChickenCoordinator, description: RunChickenSensorEntityDescription) -> None:
+        """Initialize the sensor for ``description`` on the coordinator's door."""
+        self.coordinator = coordinator
+        self.entity_description = description
+        address = coordinator.device.address
+        self._attr_unique_id = f"run_chicken_{address}_{description.key}"
+        # Same connection as the cover's device info, so it lands on that device.
+        self._attr_device_info = DeviceInfo(connections={(CONNECTION_BLUETOOTH, address)})
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the current value of the metric."""
+        return self.entity_description.value_fn(self.coordinator)
@@ -0,0 +1,112 @@
+"""Persistent per-door state for the Run-Chicken integration."""
+
+from __future__ import annotations
+
+import dataclasses
+import logging
+from typing import TYPE_CHECKING, Any, TypedDict
+
+from homeassistant.core import callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+from .run_chicken_ble.models import RunChickenDeviceData, RunChickenDoorState, RunChickenGattHandles
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+# Seconds to batch saves over; a door that chatters only costs one write.
+SAVE_DELAY = 30
+
+
+class _StoredDoor(TypedDict, total=False):
+    """On-disk layout of a door's stored record."""
+
+    name: str | None
+    # Every field of the last RunChickenDeviceData, the door state by name.
+    data: dict[str, Any]
+    model: str
+    read_handle: int
+    write_handle: int
+
+
+class RunChickenStore:
+    """
+    Remember what we last learned about a door across restarts.
+
+    Setup restores the last known state from here so entities come up at once,
+    without waiting on a BLE connection; the first connect then happens in the
+    background. The detected protocol model and GATT characteristic handles are
+    kept too, so reconnects after a restart can skip resolving them again. One
+    small file per door, keyed by its address.
+    """
+
+    def __init__(self, hass: HomeAssistant, address: str) -> None:
+        """Initialise the store for the door at ``address``."""
+        self._store: Store[_StoredDoor] = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{address.replace(':', '').lower()}")
+        self._record: _StoredDoor = {}
+
+    @property
+    def name(self) -> str | None:
+        """Return the door's last known advertised name."""
+        return self._record.get("name")
+
+    @property
+    def data(self) -> RunChickenDeviceData | None:
+        """Return the last known state snapshot, or None if nothing usable was stored."""
+        stored = self._record.get("data")
+        if stored is None:
+            return None
+        fields = dict(stored)
+        try:
+            fields["door_state"] = RunChickenDoorState[fields["door_state"]]
+            return RunChickenDeviceData(**fields)
+        except (KeyError, TypeError):
+            _LOGGER.debug("Ignoring unusable stored state %s", stored)
+            return None
+
+    @property
+    def model(self) -> str | None:
+        """Return the door's last detected protocol model."""
+        return self._record.get("model")
+
+    @property
+    def gatt_handles(self) -> RunChickenGattHandles | None:
+        """Return the cached characteristic handles, if any."""
+        read_handle = self._record.get("read_handle")
+        write_handle = self._record.get("write_handle")
+        if read_handle is None or write_handle is None:
+            return None
+        return RunChickenGattHandles(read=read_handle, write=write_handle)
+
+    async def async_load(self) -> None:
+        """Load the stored record, if there is one."""
+        self._record = await self._store.async_load() or {}
+
+    @callback
+    def async_save(self, name: str | None, data: RunChickenDeviceData) -> None:
+        """Schedule a (batched) save of the door's name and latest state."""
+        self._record.update(name=name, data={**dataclasses.asdict(data), "door_state": data.door_state.name})
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def async_save_gatt(self, model: str, handles: RunChickenGattHandles | None) -> None:
+        """Schedule a save of the detected model and GATT handles (``None`` invalidates them)."""
+        self._record["model"] = model
+        if handles is None:
+            self._record.pop("read_handle", None)
+            self._record.pop("write_handle", None)
+        else:
+            self._record.update(read_handle=handles.read, write_handle=handles.write)
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    async def async_remove(self) -> None:
+        """Delete the stored record; used when the entry is removed."""
+        await self._store.async_remove()
+
+    def _data_to_save(self) -> _StoredDoor:
+        """Return the record to write."""
+        return self._record
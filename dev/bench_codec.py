@@ -0,0 +1,103 @@
+"""
+Micro-benchmark and regression check for the command-frame codec.
+
+Checks that the precompiled ``struct.Struct`` builders produce exactly the bytes
+of the original ``bytes +=`` builders (and of frames captured from the official
+app), then times both:
+
+    python dev/bench_codec.py
+"""
+
+import datetime as dt
+import struct
+import sys
+import timeit
+from pathlib import Path
+
+# Imported standalone: through the ``run_chicken`` package it would load Home Assistant.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "custom_components" / "run_chicken"))
+
+from run_chicken_ble.protocol import GiantProtocol, RunChickenAction, T50Protocol
+
+# Command frames written by the official app, from dev/logs/btsnoop_hci_2.log.
+CAPTURED_T50_FRAMES = [
+    "0157602769576027690000000000001411141100000000000000000000000058",
+    "00e9422669e9422669000000000000173b173b000001000000000000000000b0",
+    "00eb422669eb422669000000000000173b173b00000200000000000000000032",
+]
+
+
+def legacy_crc8(packet: bytes) -> int:
+    """Bitwise CRC-8 (poly 0x07), as computed by the ``crc8`` package."""
+    crc = 0
+    for byte in packet:
+        crc ^= byte
+        for _ in range(8):
+            crc = ((crc << 1) ^ 0x07) & 0xFF if crc & 0x80 else (crc << 1) & 0xFF
+    return crc
+
+
+def legacy_t50(action: RunChickenAction, packet_time: dt.datetime) -> bytes:
+    """The T-50 builder as it was before the codec was precompiled."""
+    packet = bytes([0x01 if action is RunChickenAction.STATUS else 0x00])
+    unix_time = int(packet_time.timestamp())
+    packet += struct.pack("<I", unix_time)
+    packet += struct.pack("<I", unix_time)
+    packet += struct.pack("<6x")
+    packet += struct.pack("<B", packet_time.hour)
+    packet += struct.pack("<B", packet_time.minute)
+    packet += struct.pack("<B", packet_time.hour)
+    packet += struct.pack("<B", packet_time.minute)
+    packet += struct.pack("<2x")
+    packet += struct.pack("<B", action)
+    packet += struct.pack("<9x")
+    return packet + struct.pack("<B", legacy_crc8(packet))
+
+
+def legacy_giant(action: RunChickenAction, packet_time: dt.datetime) -> bytes:
+    """The GIANT builder as it was before the codec was precompiled."""
+    packet = bytes([0x01 if action is RunChickenAction.STATUS else 0x00])
+    packet += struct.pack("<I", int(packet_time.timestamp()))
+    packet += struct.pack("<16x")
+    packet += struct.pack("<B", action)
+    packet += struct.pack("<9x")
+    return packet + struct.pack("<B", legacy_crc8(packet))
+
+
+def check_identical() -> None:
+    """Compare the new builders with the legacy ones and the captured frames."""
+    t50, giant = T50Protocol(), GiantProtocol()
+    start = dt.datetime(2025, 11, 26, tzinfo=dt.UTC)
+    for minutes in range(0, 60 * 24 * 7, 7):
+        packet_time = start + dt.timedelta(minutes=minutes, seconds=minutes % 60)
+        for action in RunChickenAction:
+            assert t50._build(action, packet_time) == legacy_t50(action, packet_time)  # noqa: SLF001
+            assert giant._build(action, packet_time) == legacy_giant(action, packet_time)  # noqa: SLF001
+
+    for captured in CAPTURED_T50_FRAMES:
+        frame = bytes.fromhex(captured)
+        unix_time = int.from_bytes(frame[1:5], "little")
+        packet_time = dt.datetime.fromtimestamp(unix_time, dt.UTC)
+        assert t50._build(RunChickenAction(frame[21]), packet_time) == frame  # noqa: SLF001
+    print("All frames byte-identical to the legacy builders and the captures.")
+
+
+def bench() -> None:
+    """Time frame building with the legacy and precompiled builders."""
+    packet_time = dt.datetime(2025, 11, 26, 20, 17, tzinfo=dt.UTC)
+    t50, giant = T50Protocol(), GiantProtocol()
+    number = 100_000
+    cases = {
+        "legacy T-50": lambda: legacy_t50(RunChickenAction.OPEN, packet_time),
+        "struct T-50": lambda: t50._build(RunChickenAction.OPEN, packet_time),  # noqa: SLF001
+        "legacy GIANT": lambda: legacy_giant(RunChickenAction.OPEN, packet_time),
+        "struct GIANT": lambda: giant._build(RunChickenAction.OPEN, packet_time),  # noqa: SLF001
+    }
+    for name, case in cases.items():
+        seconds = min(timeit.repeat(case, number=number, repeat=5))
+        print(f"{name:>13}: {seconds / number * 1e6:6.2f} us/frame")
+
+
+if __name__ == "__main__":
+    check_identical()
+    bench()
@@ -0,0 +1,113 @@
+"""
+Import-time benchmark for the ``run_chicken_ble`` core.
+
+Imports each target module in a fresh interpreter, ``--repeat`` times, and
+reports the median wall time and ``-X importtime`` cumulative time, plus which
+heavy dependencies (Home Assistant, Bleak, asyncio) the import dragged in.
+The package is imported standalone, as ``run_chicken_ble`` with
+``custom_components/run_chicken`` on the path (the script sets that up):
+importing it as ``run_chicken.run_chicken_ble`` runs the integration's own
+``__init__``, which needs Home Assistant. Tooling and tests use ``protocol``
+and ``models`` on their own, so no target may load Home Assistant or Bleak;
+the script exits non-zero if one does. Results are printed (or written with
+``--output``) as JSON, tagged with the commit, so runs can be compared across
+commits:
+
+    python dev/bench_import.py --repeat 20 --output import.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+
+TARGETS = (
+    "run_chicken_ble.models",
+    "run_chicken_ble.protocol",
+    "run_chicken_ble",
+    "run_chicken_ble.device",
+)
+PACKAGE_ROOT = Path(__file__).resolve().parent.parent / "custom_components" / "run_chicken"
+# Reported when loaded; the first two fail the run.
+FORBIDDEN = ("homeassistant", "bleak")
+WATCHED = (*FORBIDDEN, "bleak_retry_connector", "asyncio")
+
+_PROBE = """
+import sys, time
+started = time.perf_counter()
+import {target}
+elapsed = time.perf_counter() - started
+print(elapsed, *[name for name in {watched!r} if name in sys.modules])
+"""
+
+
+def _run(target: str) -> tuple[float, float, list[str]]:
+    """Import ``target`` in a fresh interpreter; return (wall s, importtime s, watched modules loaded)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _PROBE.format(target=target, watched=WATCHED)],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [str(PACKAGE_ROOT), os.getenv("PYTHONPATH")]))},
+    )
+    elapsed, *loaded = result.stdout.split()
+    # "import time: self [us] | cumulative | imported package"; the target's own
+    # line is the last one whose package column is exactly the target.
+    cumulative = 0
+    for line in result.stderr.splitlines():
+        fields = [field.strip() for field in line.removeprefix("import time:").split("|")]
+        if len(fields) == 3 and fields[2] == target:  # noqa: PLR2004
+            cumulative = int(fields[1])
+    return float(elapsed), cumulative / 1e6, loaded
+
+
+def _commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],  # noqa: S607
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main() -> None:
+    """Benchmark every target and print (or write) the report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--targets", nargs="+", default=list(TARGETS))
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args()
+
+    results: dict[str, Any] = {}
+    failed = False
+    for target in args.targets:
+        runs = [_run(target) for _ in range(args.repeat)]
+        loaded = runs[0][2]
+        results[target] = {
+            "wall_ms": statistics.median(run[0] for run in runs) * 1000,
+            "importtime_ms": statistics.median(run[1] for run in runs) * 1000,
+            "loaded": loaded,
+        }
+        if forbidden := [name for name in loaded if name in FORBIDDEN]:
+            print(f"{target} imports {', '.join(forbidden)}", file=sys.stderr)
+            failed = True
+
+    report = {"commit": _commit(), "python": sys.version.split()[0], "repeat": args.repeat, "targets": results}
+    text = json.dumps(report, indent=2)
+    if args.output is not None:
+        args.output.write_text(text + "\n")
+    else:
+        print(text)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
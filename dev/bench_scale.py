@@ -0,0 +1,332 @@
+"""
+Scale benchmark: many Run-Chicken doors on one Home Assistant instance.
+
+Sets up ``N`` config entries in a bare Home Assistant core against simulated
+doors (see ``dev/simulator.py``; only the BLE connection and the bluetooth
+integration's lookups are faked, everything from ``async_setup_entry`` up is
+the real integration) and measures, per size:
+
+* ``async_setup_entry`` time, total and per entry;
+* event-loop lag (how late a 50 ms sleep wakes up) while idle and under load;
+* asyncio task count and resident memory per door;
+* refresh throughput while every door's advertisements flood in.
+
+Each size runs in its own process so memory numbers don't bleed into each
+other. Results are printed (or written with ``--output``) as JSON, tagged with
+the commit, so runs can be compared across commits. The repo root has to be on
+``PYTHONPATH`` for Home Assistant to find the integration:
+
+    PYTHONPATH=. python dev/bench_scale.py --sizes 10 100 500 --output scale.json
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import MappingProxyType, SimpleNamespace
+from typing import Any
+from unittest.mock import patch
+
+from homeassistant import bootstrap, config_entries, loader
+from homeassistant.components.bluetooth import BluetoothChange
+from homeassistant.core import CoreState, HomeAssistant
+from simulator import LinkConditions, SimulatedBleakClient, SimulatedDoor
+
+DOMAIN = "run_chicken"
+MANUFACTURER_ID = 43521
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+
+
+def _rss() -> int:
+    """Return the resident set size in bytes (peak RSS where /proc isn't available)."""
+    with contextlib.suppress(OSError):
+        return int(Path("/proc/self/statm").read_text().split()[1]) * _PAGE_SIZE
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def _address(index: int) -> str:
+    return ":".join(f"{octet:02X}" for octet in (0x00, 0x80, 0xE1, index >> 16 & 0xFF, index >> 8 & 0xFF, index & 0xFF))
+
+
+def _summary(samples: list[float]) -> dict[str, float | None]:
+    if not samples:
+        return {"mean": None, "p95": None, "max": None}
+    ordered = sorted(samples)
+    return {
+        "mean": statistics.fmean(ordered),
+        "p95": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+        "max": ordered[-1],
+    }
+
+
+class LoopLagMonitor:
+    """Measure how late the event loop wakes a task that sleeps ``interval`` seconds."""
+
+    def __init__(self, interval: float = 0.05) -> None:
+        self.interval = interval
+        self.samples: list[float] = []
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+
+    def take(self) -> dict[str, float | None]:
+        """Return the lag since the last call, and start a new window."""
+        samples, self.samples = self.samples, []
+        return _summary(samples)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(self.interval)
+            self.samples.append(loop.time() - started - self.interval)
+
+
+class FakeBluetooth:
+    """
+    Stand-in for the bluetooth integration's lookups and simulated doors behind them.
+
+    Doors are spread round-robin over ``adapters`` adapters, as a fleet behind a
+    few proxies would be.
+    """
+
+    def __init__(self, size: int, adapters: int, conditions: LinkConditions) -> None:
+        self.conditions = conditions
+        self.doors = {_address(index): SimulatedDoor(address=_address(index)) for index in range(size)}
+        self.sources = {address: f"proxy_{index % adapters}" for index, address in enumerate(self.doors)}
+        self.callbacks: dict[str, Any] = {}
+
+    def ble_device_from_address(self, _hass: HomeAssistant, address: str, connectable: bool = True) -> Any:  # noqa: ARG002, FBT001, FBT002
+        from bleak.backends.device import BLEDevice  # noqa: PLC0415
+
+        return BLEDevice(address, self.doors[address].name, None)
+
+    def last_service_info(self, _hass: HomeAssistant, address: str, connectable: bool = True) -> Any:  # noqa: ARG002, FBT001, FBT002
+        return SimpleNamespace(source=self.sources[address])
+
+    def register_callback(self, _hass: HomeAssistant, callback: Any, matcher: Any, _mode: Any) -> Any:
+        address = matcher["address"]
+        self.callbacks[address] = callback
+        return lambda: self.callbacks.pop(address, None)
+
+    async def establish_connection(self, device: Any, disconnected_callback: Any) -> SimulatedBleakClient:
+        client = SimulatedBleakClient(self.doors[device.address], self.conditions, disconnected_callback)
+        await client.connect()
+        return client
+
+    def advertise(self, address: str, status: bytes) -> None:
+        """Deliver one advertisement from the door at ``address``."""
+        door = self.doors[address]
+        mac = bytes.fromhex(address.replace(":", ""))
+        service_info = SimpleNamespace(
+            address=address,
+            name=door.name,
+            rssi=-70,
+            source=self.sources[address],
+            device=self.ble_device_from_address(None, address),
+            manufacturer_data={MANUFACTURER_ID: status + mac},
+        )
+        self.callbacks[address](service_info, BluetoothChange.ADVERTISEMENT)
+
+
+async def _async_start_hass(config_dir: str) -> HomeAssistant:
+    """Bring up a bare Home Assistant core, enough to set up config entries."""
+    hass = HomeAssistant(config_dir)
+    loader.async_setup(hass)
+    await bootstrap.async_load_base_functionality(hass)
+    hass.config_entries = config_entries.ConfigEntries(hass, {})
+    await hass.config_entries.async_initialize()
+    # The real Bluetooth stack is replaced by FakeBluetooth.
+    hass.config.components.update({"bluetooth", "bluetooth_adapters"})
+    hass.set_state(CoreState.running)
+    return hass
+
+
+def _entry(address: str) -> config_entries.ConfigEntry:
+    return config_entries.ConfigEntry(
+        data={},
+        discovery_keys=MappingProxyType({}),
+        domain=DOMAIN,
+        minor_version=1,
+        options={},
+        source=config_entries.SOURCE_USER,
+        subentries_data=None,
+        title=f"Run-Chicken {address}",
+        unique_id=address,
+        version=1,
+    )
+
+
+async def _async_measure(args: argparse.Namespace, size: int) -> dict[str, Any]:  # noqa: PLR0915
+    """Set up ``size`` doors, let them settle, flood them with advertisements, and measure."""
+    conditions = LinkConditions(latency=args.latency, jitter=args.latency, connect_latency=args.connect_latency)
+    bluetooth = FakeBluetooth(size, args.adapters, conditions)
+    module = "custom_components.run_chicken"
+
+    async def establish(device: Any, disconnected_callback: Any) -> SimulatedBleakClient:
+        return await bluetooth.establish_connection(device, disconnected_callback)
+
+    with (
+        tempfile.TemporaryDirectory() as config_dir,
+        patch(f"{module}.async_ble_device_from_address", bluetooth.ble_device_from_address),
+        patch(f"{module}.coordinator.async_last_service_info", bluetooth.last_service_info),
+        patch(f"{module}.coordinator.async_register_callback", bluetooth.register_callback),
+        patch(f"{module}.run_chicken_ble.device.RunChickenDevice._async_establish_connection", establish),
+    ):
+        hass = await _async_start_hass(config_dir)
+        monitor = LoopLagMonitor()
+        monitor.start()
+        # Import the integration (and Home Assistant's cover platform) up front
+        # so the first entry doesn't pay for every import.
+        await loader.async_get_integration(hass, DOMAIN)
+        await asyncio.sleep(0.5)
+        idle_lag = monitor.take()
+        tasks_before = len(asyncio.all_tasks())
+        rss_before = _rss()
+
+        setup_times = []
+        started = time.perf_counter()
+        for address in bluetooth.doors:
+            entry_started = time.perf_counter()
+            await hass.config_entries.async_add(_entry(address))
+            setup_times.append(time.perf_counter() - entry_started)
+        setup_total = time.perf_counter() - started
+        setup_lag = monitor.take()
+        coordinators = [entry.runtime_data for entry in hass.config_entries.async_entries(DOMAIN)]
+
+        # Let the background first refreshes connect, up to the settle timeout.
+        settle_started = time.perf_counter()
+        while time.perf_counter() - settle_started < args.settle_timeout:
+            if all(coordinator.device.is_connected for coordinator in coordinators):
+                break
+            await asyncio.sleep(0.1)
+        settled = sum(coordinator.device.is_connected for coordinator in coordinators)
+        settle_time = time.perf_counter() - settle_started
+        settle_lag = monitor.take()
+        rss_after = _rss()
+        tasks_after = len(asyncio.all_tasks())
+
+        # Flood: every door advertises ``args.advert_rate`` times a second; a share
+        # of the adverts carry a changed payload, which asks for a refresh.
+        refreshes_before = sum(coordinator.refresh_scheduler.stats.refreshes for coordinator in coordinators)
+        triggers_before = sum(coordinator.refresh_scheduler.stats.triggers for coordinator in coordinators)
+        adverts = 0
+        handler_time = 0.0
+        tick = 0.1
+        per_tick = max(1, round(args.advert_rate * tick))
+        flood_started = time.perf_counter()
+        while time.perf_counter() - flood_started < args.flood_duration:
+            tick_started = time.perf_counter()
+            for address in bluetooth.doors:
+                for _ in range(per_tick):
+                    changed = (adverts % round(1 / args.changed_ratio)) == 0 if args.changed_ratio else False
+                    status = bytes([0, 0, 0, adverts & 0xFF]) if changed else bytes(4)
+                    handler_started = time.perf_counter()
+                    bluetooth.advertise(address, status)
+                    handler_time += time.perf_counter() - handler_started
+                    adverts += 1
+            await asyncio.sleep(max(0.0, tick - (time.perf_counter() - tick_started)))
+        flood_elapsed = time.perf_counter() - flood_started
+        flood_lag = monitor.take()
+        tasks_flood = len(asyncio.all_tasks())
+        stats = [coordinator.refresh_scheduler.stats for coordinator in coordinators]
+        refreshes = sum(stat.refreshes for stat in stats) - refreshes_before
+        triggers = sum(stat.triggers for stat in stats) - triggers_before
+
+        await monitor.stop()
+        for entry in hass.config_entries.async_entries(DOMAIN):
+            await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_stop(force=True)
+
+    return {
+        "size": size,
+        "setup": {
+            "total": setup_total,
+            "per_entry": _summary(setup_times),
+            "loop_lag": setup_lag,
+        },
+        "settle": {"connected": settled, "seconds": settle_time, "loop_lag": settle_lag},
+        "idle_loop_lag": idle_lag,
+        "tasks": {"before": tasks_before, "after_setup": tasks_after, "during_flood": tasks_flood},
+        "memory": {"rss_delta": rss_after - rss_before, "per_door": (rss_after - rss_before) / size},
+        "flood": {
+            "adverts": adverts,
+            "adverts_per_second": adverts / flood_elapsed,
+            "handler_seconds_per_advert": handler_time / adverts if adverts else None,
+            "refresh_triggers": triggers,
+            "refreshes": refreshes,
+            "refreshes_per_second": refreshes / flood_elapsed,
+            "loop_lag": flood_lag,
+        },
+    }
+
+
+def _commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],  # noqa: S607
+            capture_output=True,
+            check=True,
+            text=True,
+            cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main() -> None:
+    """Run every size in a child process and emit the combined results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 500])
+    parser.add_argument("--adapters", type=int, default=4, help="proxies the doors are spread over")
+    parser.add_argument("--latency", type=float, default=0.01, help="simulated GATT round trip, seconds")
+    parser.add_argument("--connect-latency", type=float, default=0.2, help="simulated connect time, seconds")
+    parser.add_argument("--settle-timeout", type=float, default=30.0, help="max seconds to wait for first connects")
+    parser.add_argument("--flood-duration", type=float, default=15.0)
+    parser.add_argument("--advert-rate", type=float, default=1.0, help="advertisements per door per second")
+    parser.add_argument("--changed-ratio", type=float, default=0.1, help="share of adverts with a new payload")
+    parser.add_argument("--output", type=Path, help="write the JSON here instead of stdout")
+    parser.add_argument("--child", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child is not None:
+        json.dump(asyncio.run(_async_measure(args, args.child)), sys.stdout)
+        return
+
+    results = []
+    for size in args.sizes:
+        print(f"Benchmarking {size} doors...", file=sys.stderr)
+        # The child takes the same options and prints its result instead of writing it.
+        child = subprocess.run(
+            [sys.executable, __file__, *sys.argv[1:], "--child", str(size)],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+        results.append(json.loads(child.stdout))
+    options = {key: value for key, value in vars(args).items() if key not in ("child", "output")}
+    report = {"commit": _commit(), "python": sys.version.split()[0], "options": options, "results": results}
+    text = json.dumps(report, indent=2)
+    if args.output is not None:
+        args.output.write_text(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,424 @@
+"""
+Memory-mapped btsnoop / HCI / L2CAP / ATT decoder for Run-Chicken captures.
+
+Decodes an Android ``btsnoop_hci.log`` straight from a memory map, so captures of
+any size are walked record by record without being read into memory. ACL
+fragments are reassembled into L2CAP PDUs, ATT traffic is indexed by connection
+handle, and characteristic UUIDs are resolved from the GATT discovery the app
+performs, which picks out writes to ``WRITE_CHAR_UUID`` and notifications/reads
+of ``READ_CHAR_UUID``:
+
+    python dev/btsnoop.py dev/logs/btsnoop_hci_*.log
+    python dev/btsnoop.py dev/logs/btsnoop_hci_2.log --export capture.log
+    python dev/btsnoop.py dev/logs/btsnoop_hci_2.log --json
+
+Besides the traffic itself it reports the app's connection setup phases and its
+write-to-notification latency, a baseline to compare the integration against.
+"""
+
+import argparse
+import dataclasses
+import json
+import mmap
+import statistics
+import struct
+import sys
+import uuid
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, Self
+
+# Imported standalone: through the ``run_chicken`` package it would load Home Assistant.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "custom_components" / "run_chicken"))
+
+from run_chicken_ble.protocol import READ_CHAR_UUID, WRITE_CHAR_UUID
+from run_chicken_ble.recording import BINARY_MAGIC, RecordFormat, encode_messages
+
+BTSNOOP_MAGIC = b"btsnoop\x00"
+_FILE_HEADER = struct.Struct(">8sII")
+# Original length, included length, flags, cumulative drops, timestamp.
+_RECORD_HEADER = struct.Struct(">IIIIq")
+# btsnoop timestamps count microseconds from 0000-01-01; this is the Unix epoch.
+_EPOCH_OFFSET_US = 0x00DCDDB30F2F8000
+
+# HCI packet indicators.
+_HCI_COMMAND = 0x01
+_HCI_ACL = 0x02
+_HCI_EVENT = 0x04
+# HCI commands and events around a connection's lifetime.
+_LE_CREATE_CONNECTION = (0x200D, 0x2043)
+_EVENT_DISCONNECTION_COMPLETE = 0x05
+_EVENT_LE_META = 0x3E
+_LE_CONNECTION_COMPLETE = (0x01, 0x0A)
+# ACL packet-boundary flag of a continuation fragment.
+_ACL_CONTINUATION = 0x01
+_L2CAP_ATT_CID = 0x0004
+
+# ATT opcodes.
+_ATT_MTU_RESPONSE = 0x03
+_ATT_FIND_INFORMATION_RESPONSE = 0x05
+_ATT_READ_BY_TYPE_REQUEST = 0x08
+_ATT_READ_BY_TYPE_RESPONSE = 0x09
+_ATT_READ_REQUEST = 0x0A
+_ATT_READ_RESPONSE = 0x0B
+_ATT_READ_BY_GROUP_TYPE_RESPONSE = 0x11
+_ATT_WRITE_REQUEST = 0x12
+_ATT_NOTIFICATION = 0x1B
+_ATT_INDICATION = 0x1D
+_ATT_WRITE_COMMAND = 0x52
+_ATT_DISCOVERY_RESPONSES = (
+    _ATT_FIND_INFORMATION_RESPONSE,
+    _ATT_READ_BY_TYPE_RESPONSE,
+    _ATT_READ_BY_GROUP_TYPE_RESPONSE,
+)
+_ATT_PUSHED = (_ATT_NOTIFICATION, _ATT_INDICATION)
+_ATT_WRITES = (_ATT_WRITE_REQUEST, _ATT_WRITE_COMMAND)
+# 16-bit UUID of a characteristic declaration, as requested in Read By Type.
+_CHARACTERISTIC_DECLARATION = 0x2803
+# Values written to a Client Characteristic Configuration descriptor to subscribe.
+_CCCD_SUBSCRIBE = (b"\x01\x00", b"\x02\x00")
+_BLUETOOTH_BASE_UUID = "0000{:04x}-0000-1000-8000-00805f9b34fb"
+
+# Attribute handles of the read and write characteristics on the T-80 in these
+# captures; used when a connection's GATT discovery isn't in the capture.
+DEFAULT_READ_HANDLE = 0x000E
+DEFAULT_WRITE_HANDLE = 0x0012
+
+
+@dataclasses.dataclass(slots=True)
+class AttValue:
+    """One attribute value sent to (``TX``) or received from (``RX``) a peer."""
+
+    timestamp: float
+    connection: int
+    direction: str
+    opcode: int
+    handle: int
+    value: bytes
+
+
+@dataclasses.dataclass
+class Connection:
+    """An LE connection seen in a capture, with the times of its setup phases."""
+
+    handle: int
+    peer: str | None = None
+    #: Host asked the controller to connect (LE Create Connection).
+    create_requested: float | None = None
+    connected: float | None = None
+    mtu_exchanged: float | None = None
+    #: Last GATT discovery response; the app has resolved its handles by then.
+    discovered: float | None = None
+    subscribed: float | None = None
+    disconnected: float | None = None
+    #: Characteristic UUID to value handle, from the GATT discovery.
+    characteristics: dict[str, int] = dataclasses.field(default_factory=dict)
+    values: list[AttValue] = dataclasses.field(default_factory=list)
+    # Decoder state: the handle of an outstanding read request, and whether the
+    # outstanding Read By Type request is for characteristic declarations.
+    _pending_read: int | None = dataclasses.field(default=None, repr=False)
+    _reading_declarations: bool = dataclasses.field(default=False, repr=False)
+
+    @property
+    def read_handle(self) -> int:
+        """Return the value handle of ``READ_CHAR_UUID`` on this connection."""
+        return self.characteristics.get(READ_CHAR_UUID, DEFAULT_READ_HANDLE)
+
+    @property
+    def write_handle(self) -> int:
+        """Return the value handle of ``WRITE_CHAR_UUID`` on this connection."""
+        return self.characteristics.get(WRITE_CHAR_UUID, DEFAULT_WRITE_HANDLE)
+
+    def is_door_traffic(self, value: AttValue) -> bool:
+        """Return whether ``value`` is a command write or a status read/notification."""
+        if value.direction == "TX":
+            return value.handle == self.write_handle and value.opcode in _ATT_WRITES
+        return value.handle == self.read_handle
+
+    def phases(self) -> dict[str, float]:
+        """Return the seconds each setup phase took, from the connect request to the first command."""
+        first_write = next(
+            (value.timestamp for value in self.values if value.direction == "TX" and self.is_door_traffic(value)),
+            None,
+        )
+        steps = {
+            "connect": self.connected,
+            "mtu": self.mtu_exchanged,
+            "discovery": self.discovered,
+            "subscribe": self.subscribed,
+            "first_write": first_write,
+        }
+        previous = self.create_requested or self.connected
+        if previous is None:
+            return {}
+        # The app doesn't always go in the same order (discovery can finish before
+        # the MTU exchange), so each phase runs from the step that came before it.
+        phases = {}
+        for name, timestamp in sorted(
+            ((name, timestamp) for name, timestamp in steps.items() if timestamp is not None),
+            key=lambda step: step[1],
+        ):
+            phases[name] = timestamp - previous
+            previous = timestamp
+        return phases
+
+    def write_notify_latencies(self) -> list[float]:
+        """Return, for every command write, the seconds until the next status frame from the door."""
+        latencies = []
+        pending: float | None = None
+        for value in self.values:
+            if not self.is_door_traffic(value):
+                continue
+            if value.direction == "TX":
+                pending = value.timestamp
+            elif pending is not None:
+                latencies.append(value.timestamp - pending)
+                pending = None
+        return latencies
+
+
+class BtsnoopCapture:
+    """
+    A btsnoop capture, decoded lazily from a memory map.
+
+    ``att_values`` walks the capture once and, as it goes, fills in
+    ``connections`` (the live ones, by connection handle) and ``history``
+    (every connection in order, since the controller reuses handles).
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Map the capture at ``path`` and check its header."""
+        self.path = Path(path)
+        with self.path.open("rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, _version, _datalink = _FILE_HEADER.unpack_from(self._map)
+        if magic != BTSNOOP_MAGIC:
+            self.close()
+            msg = f"{self.path} is not a btsnoop capture"
+            raise ValueError(msg)
+        self.connections: dict[int, Connection] = {}
+        self.history: list[Connection] = []
+
+    def __enter__(self) -> Self:
+        """Return the capture itself."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Unmap the capture."""
+        self.close()
+
+    def close(self) -> None:
+        """Unmap the capture."""
+        self._map.close()
+
+    def records(self) -> Iterator[tuple[float, bool, bytes]]:
+        """Yield ``(unix time, received, packet)`` for every record."""
+        data = self._map
+        offset = _FILE_HEADER.size
+        end = len(data) - _RECORD_HEADER.size
+        while offset <= end:
+            _original, included, flags, _drops, timestamp = _RECORD_HEADER.unpack_from(data, offset)
+            offset += _RECORD_HEADER.size
+            yield (timestamp - _EPOCH_OFFSET_US) / 1e6, bool(flags & 0x01), data[offset : offset + included]
+            offset += included
+
+    def att_values(self) -> Iterator[AttValue]:
+        """Yield every ATT value exchanged on any connection, reassembling fragmented PDUs."""
+        self.connections.clear()
+        self.history.clear()
+        # Partial L2CAP PDUs, per connection handle and direction.
+        partial: dict[tuple[int, bool], bytearray] = {}
+        pending_create: float | None = None
+        for timestamp, received, packet in self.records():
+            if not packet:
+                continue
+            if packet[0] == _HCI_COMMAND:
+                if int.from_bytes(packet[1:3], "little") in _LE_CREATE_CONNECTION:
+                    pending_create = timestamp
+            elif packet[0] == _HCI_EVENT:
+                pending_create = self._event(timestamp, packet, pending_create)
+            elif packet[0] == _HCI_ACL and len(packet) >= 5:  # noqa: PLR2004
+                header = int.from_bytes(packet[1:3], "little")
+                key = (header & 0x0FFF, received)
+                if (header >> 12) & 0x03 == _ACL_CONTINUATION:
+                    if key not in partial:
+                        continue
+                    partial[key] += packet[5:]
+                else:
+                    partial[key] = bytearray(packet[5:])
+                pdu = partial[key]
+                # L2CAP basic header: payload length (2), channel ID (2).
+                if len(pdu) < 4 or len(pdu) < 4 + int.from_bytes(pdu[:2], "little"):  # noqa: PLR2004
+                    continue
+                del partial[key]
+                if int.from_bytes(pdu[2:4], "little") == _L2CAP_ATT_CID:
+                    yield from self._att(timestamp, key[0], received, bytes(pdu[4:]))
+
+    def door_values(self) -> Iterator[AttValue]:
+        """Yield only the door traffic: command writes and status reads/notifications."""
+        for value in self.att_values():
+            if self.connections[value.connection].is_door_traffic(value):
+                yield value
+
+    def _connection(self, handle: int) -> Connection:
+        """Return the connection with ``handle``, creating it if the capture missed its start."""
+        connection = self.connections.get(handle)
+        if connection is None:
+            connection = self.connections[handle] = Connection(handle)
+            self.history.append(connection)
+        return connection
+
+    def _event(self, timestamp: float, packet: bytes, pending_create: float | None) -> float | None:
+        """Track connection lifetimes from HCI events; return the still-pending create request."""
+        code, params = packet[1], packet[3:]
+        if code == _EVENT_LE_META and len(params) >= 12 and params[0] in _LE_CONNECTION_COMPLETE and params[1] == 0:  # noqa: PLR2004
+            # Subevent, status, handle (2), role, peer address type, peer address (6).
+            handle = int.from_bytes(params[2:4], "little")
+            connection = self.connections[handle] = Connection(
+                handle,
+                peer=":".join(f"{octet:02X}" for octet in reversed(params[6:12])),
+                create_requested=pending_create,
+                connected=timestamp,
+            )
+            self.history.append(connection)
+            return None
+        if code == _EVENT_DISCONNECTION_COMPLETE and len(params) >= 3 and params[0] == 0:  # noqa: PLR2004
+            handle = int.from_bytes(params[1:3], "little")
+            if handle in self.connections:
+                self.connections[handle].disconnected = timestamp
+        return pending_create
+
+    def _att(self, timestamp: float, handle: int, received: bool, pdu: bytes) -> Iterator[AttValue]:  # noqa: FBT001
+        """Decode one ATT PDU, updating its connection and yielding the value it carries, if any."""
+        if not pdu:
+            return
+        connection = self._connection(handle)
+        opcode = pdu[0]
+        if opcode == _ATT_MTU_RESPONSE:
+            connection.mtu_exchanged = timestamp
+        elif opcode in _ATT_DISCOVERY_RESPONSES:
+            connection.discovered = timestamp
+            if opcode == _ATT_READ_BY_TYPE_RESPONSE and connection._reading_declarations:  # noqa: SLF001
+                _parse_declarations(connection, pdu)
+        elif opcode == _ATT_READ_BY_TYPE_REQUEST:
+            # Start handle (2), end handle (2), then the attribute type being read.
+            connection._reading_declarations = pdu[5:] == _CHARACTERISTIC_DECLARATION.to_bytes(2, "little")  # noqa: SLF001
+        elif opcode == _ATT_READ_REQUEST and len(pdu) >= 3:  # noqa: PLR2004
+            connection._pending_read = int.from_bytes(pdu[1:3], "little")  # noqa: SLF001
+        elif opcode == _ATT_READ_RESPONSE and connection._pending_read is not None:  # noqa: SLF001
+            yield self._value(connection, timestamp, "RX", opcode, connection._pending_read, pdu[1:])  # noqa: SLF001
+            connection._pending_read = None  # noqa: SLF001
+        elif opcode in _ATT_PUSHED + _ATT_WRITES and len(pdu) >= 3:  # noqa: PLR2004
+            attribute = int.from_bytes(pdu[1:3], "little")
+            value = pdu[3:]
+            if opcode == _ATT_WRITE_REQUEST and value in _CCCD_SUBSCRIBE and attribute == connection.read_handle + 1:
+                connection.subscribed = timestamp
+            yield self._value(connection, timestamp, "RX" if received else "TX", opcode, attribute, value)
+
+    @staticmethod
+    def _value(  # noqa: PLR0913
+        connection: Connection, timestamp: float, direction: str, opcode: int, handle: int, value: bytes
+    ) -> AttValue:
+        """Record an attribute value on its connection and return it."""
+        att_value = AttValue(timestamp, connection.handle, direction, opcode, handle, value)
+        connection.values.append(att_value)
+        return att_value
+
+
+def _parse_declarations(connection: Connection, pdu: bytes) -> None:
+    """Map characteristic UUIDs to value handles from a Read By Type response."""
+    # Each entry: declaration handle (2), properties (1), value handle (2), UUID (2 or 16).
+    length = pdu[1]
+    if length not in (7, 21):
+        return
+    for offset in range(2, len(pdu) - length + 1, length):
+        value_handle = int.from_bytes(pdu[offset + 3 : offset + 5], "little")
+        raw_uuid = pdu[offset + 5 : offset + length]
+        if len(raw_uuid) == 2:  # noqa: PLR2004
+            characteristic = _BLUETOOTH_BASE_UUID.format(int.from_bytes(raw_uuid, "little"))
+        else:
+            characteristic = str(uuid.UUID(bytes=raw_uuid[::-1]))
+        connection.characteristics[characteristic] = value_handle
+
+
+def export(values: list[AttValue], path: Path, record_format: RecordFormat) -> None:
+    """Write ``values`` to ``path`` as a raw-byte recording, readable by ``dev/replay.py``."""
+    data = encode_messages(record_format, ((value.timestamp, value.direction, value.value) for value in values))
+    with path.open("wb") as file:
+        if record_format is RecordFormat.BINARY:
+            file.write(BINARY_MAGIC)
+        file.write(data)
+
+
+def summarise(capture: BtsnoopCapture) -> dict[str, Any]:
+    """Return the door connections of a fully decoded capture, with their timing stats."""
+    connections = []
+    for connection in capture.history:
+        door_values = [value for value in connection.values if connection.is_door_traffic(value)]
+        if not door_values:
+            continue
+        latencies = connection.write_notify_latencies()
+        connections.append(
+            {
+                "handle": connection.handle,
+                "peer": connection.peer,
+                "handles_discovered": READ_CHAR_UUID in connection.characteristics,
+                "writes": sum(value.direction == "TX" for value in door_values),
+                "status_frames": sum(value.direction == "RX" for value in door_values),
+                "phases": connection.phases(),
+                "write_notify_latency": {
+                    "count": len(latencies),
+                    "min": min(latencies, default=None),
+                    "median": statistics.median(latencies) if latencies else None,
+                    "max": max(latencies, default=None),
+                },
+            }
+        )
+    return {"capture": capture.path.name, "connections": connections}
+
+
+def _print_summary(summary: dict[str, Any]) -> None:
+    """Print a capture summary for a human."""
+    print(summary["capture"])
+    for connection in summary["connections"]:
+        phases = ", ".join(f"{name} {seconds * 1000:.0f} ms" for name, seconds in connection["phases"].items())
+        print(
+            f"  handle 0x{connection['handle']:03x} ({connection['peer'] or 'peer unknown'}): "
+            f"{connection['writes']} writes, {connection['status_frames']} status frames"
+        )
+        print(f"    setup: {phases or 'not in capture'}")
+        latency = connection["write_notify_latency"]
+        if latency["count"]:
+            print(
+                f"    write->notify: min {latency['min'] * 1000:.0f} ms, median {latency['median'] * 1000:.0f} ms, "
+                f"max {latency['max'] * 1000:.0f} ms over {latency['count']} writes"
+            )
+
+
+def main() -> None:
+    """Decode the captures given on the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("paths", nargs="+", type=Path, help="btsnoop captures")
+    parser.add_argument("--export", type=Path, help="write the door traffic of all captures to this recording")
+    parser.add_argument("--format", type=RecordFormat, default=RecordFormat.TEXT, help="format of --export")
+    parser.add_argument("--json", action="store_true", help="print the summaries as JSON")
+    args = parser.parse_args()
+
+    exported: list[AttValue] = []
+    summaries = []
+    for path in args.paths:
+        with BtsnoopCapture(path) as capture:
+            exported.extend(capture.door_values())
+            summaries.append(summarise(capture))
+    if args.export:
+        export(exported, args.export, args.format)
+    if args.json:
+        json.dump(summaries, sys.stdout, indent=2)
+        print()
+    else:
+        for summary in summaries:
+            _print_summary(summary)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+Replay recorded Run-Chicken traffic through the integration's decoder.
+
+Streams raw-byte recordings (text or binary, gzip-rotated backups included) and
+btsnoop HCI captures one frame at a time, decodes every RX frame exactly as
+``RunChickenDevice.data_from_bytes`` does, and reports the decoded state
+transitions, the decode throughput and any frame that didn't decode. Handy for
+checking a protocol change against weeks of captured traffic:
+
+    python dev/replay.py dev/logs/btsnoop_hci_*.log
+    python dev/replay.py run_chicken_0080e122430d.bin* --model GIANT --json
+"""
+
+import argparse
+import dataclasses
+import datetime as dt
+import gzip
+import json
+import sys
+import time
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+# Imported standalone: through the ``run_chicken`` package it would load Home Assistant.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "custom_components" / "run_chicken"))
+
+from btsnoop import BTSNOOP_MAGIC, BtsnoopCapture
+from run_chicken_ble.models import RunChickenDeviceData, RunChickenDoorState
+from run_chicken_ble.protocol import RunChickenProtocol, T50Protocol
+from run_chicken_ble.recording import BINARY_MAGIC, Message, decode_binary, decode_text
+
+
+@dataclasses.dataclass
+class ReplayReport:
+    """Outcome of replaying one or more files."""
+
+    rx_frames: int = 0
+    tx_frames: int = 0
+    #: Wall-clock seconds spent decoding (reading the files is not counted).
+    decode_seconds: float = 0.0
+    #: ``(timestamp, file, from, to)`` for every change of the decoded state.
+    transitions: list[tuple[float, str, str, str]] = dataclasses.field(default_factory=list)
+    #: ``(timestamp, file, hex payload)`` for every RX frame that didn't decode.
+    undecodable: list[tuple[float, str, str]] = dataclasses.field(default_factory=list)
+    #: ``(file, line number, line)`` for every text-recording line that didn't parse.
+    malformed: list[tuple[str, int, str]] = dataclasses.field(default_factory=list)
+
+    @property
+    def frames_per_second(self) -> float:
+        """Return the decode throughput."""
+        return self.rx_frames / self.decode_seconds if self.decode_seconds else 0.0
+
+
+def iter_frames(path: Path, on_malformed: Callable[[int, str], None] | None = None) -> Iterator[Message]:
+    """
+    Yield ``(unix time, "RX" | "TX", payload)`` from a recording or capture, streaming.
+
+    A text-recording line that doesn't parse is skipped and handed to
+    ``on_malformed`` as ``(line number, line)``.
+    """
+    opener = gzip.open if path.suffix == ".gz" else open
+    with opener(path, "rb") as file:
+        head = file.read(len(BTSNOOP_MAGIC))
+        file.seek(0)
+        if head == BTSNOOP_MAGIC:
+            # Decoded from a memory map rather than the open file.
+            with BtsnoopCapture(path) as capture:
+                for value in capture.door_values():
+                    yield value.timestamp, value.direction, value.value
+        elif head.startswith(BINARY_MAGIC):
+            yield from decode_binary(file)
+        else:
+            yield from decode_text(file, on_malformed)
+
+
+def replay(paths: list[Path], protocol: RunChickenProtocol) -> ReplayReport:
+    """Decode every RX frame in ``paths``, in order, and collect the report."""
+    report = ReplayReport()
+    for path in paths:
+        # Each file is its own session; don't diff its first frame against the last file's.
+        previous = "-"
+
+        def on_malformed(number: int, line: str, name: str = path.name) -> None:
+            report.malformed.append((name, number, line))
+
+        for timestamp, direction, payload in iter_frames(path, on_malformed):
+            if direction != "RX":
+                report.tx_frames += 1
+                continue
+            report.rx_frames += 1
+            start = time.perf_counter()
+            data = RunChickenDeviceData.from_status_frame(protocol.parse_status_frame(payload))
+            report.decode_seconds += time.perf_counter() - start
+            if data.door_state is RunChickenDoorState.UNKNOWN:
+                report.undecodable.append((timestamp, path.name, payload.hex()))
+                continue
+            if (state := _describe(data)) != previous:
+                report.transitions.append((timestamp, path.name, previous, state))
+            previous = state
+    return report
+
+
+def _describe(data: RunChickenDeviceData) -> str:
+    """Short human-readable form of the door state in a snapshot."""
+    return f"{data.door_state.name}{' (moving)' if data.motor_running else ''}"
+
+
+def _print_report(report: ReplayReport) -> None:
+    """Print the report for a human."""
+    for timestamp, name, old, new in report.transitions:
+        print(f"{dt.datetime.fromtimestamp(timestamp, dt.UTC).isoformat()} {name}: {old} -> {new}")
+    for timestamp, name, payload in report.undecodable:
+        print(f"{dt.datetime.fromtimestamp(timestamp, dt.UTC).isoformat()} {name}: undecodable {payload}")
+    for name, number, line in report.malformed:
+        print(f"{name}:{number}: skipped malformed line {line!r}")
+    print(
+        f"{report.rx_frames} RX / {report.tx_frames} TX frames, {len(report.transitions)} transitions, "
+        f"{len(report.undecodable)} undecodable, {len(report.malformed)} malformed lines, "
+        f"{report.frames_per_second:,.0f} frames/s decoded"
+    )
+
+
+def main() -> int:
+    """Replay the files given on the command line; exit non-zero if any frame or line didn't decode."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("paths", nargs="+", type=Path, help="recordings or btsnoop captures, replayed in order")
+    parser.add_argument("--model", default=T50Protocol.model, help="door protocol to decode with")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args()
+
+    protocol = RunChickenProtocol.for_model(args.model)
+    if protocol is None:
+        parser.error(f"unknown model {args.model}")
+    report = replay(args.paths, protocol)
+    if args.json:
+        json.dump({**dataclasses.asdict(report), "frames_per_second": report.frames_per_second}, sys.stdout, indent=2)
+        print()
+    else:
+        _print_report(report)
+    return 1 if report.undecodable or report.malformed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,459 @@
+"""
+In-process Run-Chicken door simulator, standing in for a ``BleakClient``.
+
+``SimulatedDoor`` behaves like the door as far as the integration can tell: it
+validates every command frame (length, CRC-8, session-init "hello" first),
+moves for a while on open/close, and pushes status frames shaped like the ones
+in ``dev/logs``. ``SimulatedBleakClient`` exposes the GATT surface the
+integration uses (``services``, ``read_gatt_char``, ``write_gatt_char``,
+``start_notify`` and the disconnected callback) with configurable latency,
+packet loss and random disconnects, and ``SimulatedRunChickenDevice`` plugs it
+into ``RunChickenDevice`` in place of a real connection.
+
+Running the module drives a simulated door through a series of commands and
+reports command latency and reconnect behaviour:
+
+    python dev/simulator.py --model GIANT --loss 0.05 --disconnect-rate 0.02
+"""
+
+import argparse
+import asyncio
+import dataclasses
+import json
+import logging
+import pathlib
+import random
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from typing import Any
+
+# Imported standalone: through the ``run_chicken`` package it would load Home Assistant.
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent / "custom_components" / "run_chicken"))
+
+from bleak.backends.device import BLEDevice
+from bleak.exc import BleakError
+from run_chicken_ble.device import RunChickenDevice
+from run_chicken_ble.models import RunChickenDoorState
+from run_chicken_ble.protocol import (
+    READ_CHAR_UUID,
+    WRITE_CHAR_UUID,
+    RunChickenAction,
+    RunChickenProtocol,
+    crc8,
+)
+from run_chicken_ble.trace import RunChickenTracer
+
+_LOGGER = logging.getLogger(__name__)
+
+# Attribute handles of the characteristics on the T-80 in dev/logs.
+READ_HANDLE = 0x000E
+WRITE_HANDLE = 0x0012
+# Status-frame types seen in the captures: a reply to a write, and a push after movement.
+FRAME_REPLY = 0x48
+FRAME_PUSH = 0xB5
+_MOTOR_RUNNING = 0x20
+_DOOR_STATE_BYTES = {RunChickenDoorState.OPEN: 0, RunChickenDoorState.CLOSED: 1}
+# Where the action and session flag sit in a command frame, for both models.
+_ACTION_OFFSET = 21
+_SESSION_OFFSET = 0
+
+
+@dataclasses.dataclass
+class LinkConditions:
+    """Radio conditions between the simulated door and its client."""
+
+    #: Seconds each GATT operation (and notification) takes, plus up to ``jitter``.
+    latency: float = 0.03
+    jitter: float = 0.02
+    connect_latency: float = 0.5
+    #: Probability that a write times out (dropping the link) or a notification is lost.
+    loss: float = 0.0
+    #: Probability that the link drops after any GATT operation.
+    disconnect_rate: float = 0.0
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class SimulatedCharacteristic:
+    """The parts of a ``BleakGATTCharacteristic`` the integration looks at."""
+
+    uuid: str
+    handle: int
+    properties: tuple[str, ...]
+
+
+class SimulatedServices:
+    """The parts of a ``BleakGATTServiceCollection`` the integration looks at."""
+
+    def __init__(self, characteristics: list[SimulatedCharacteristic]) -> None:
+        """Index ``characteristics`` by handle and UUID."""
+        self._by_handle = {characteristic.handle: characteristic for characteristic in characteristics}
+        self._by_uuid = {characteristic.uuid: characteristic for characteristic in characteristics}
+
+    def get_characteristic(self, specifier: int | str | SimulatedCharacteristic) -> SimulatedCharacteristic | None:
+        """Look a characteristic up by handle, UUID or the characteristic itself."""
+        if isinstance(specifier, SimulatedCharacteristic):
+            return specifier
+        if isinstance(specifier, int):
+            return self._by_handle.get(specifier)
+        return self._by_uuid.get(str(specifier).lower())
+
+
+class SimulatedDoor:
+    """
+    A Run-Chicken door: frame validation, door movement and status frames.
+
+    Frames that fail validation are ignored, as the real door ignores them, and
+    recorded in ``violations``. Only one client can be connected at a time.
+    """
+
+    def __init__(
+        self,
+        model: str = "T-50",
+        *,
+        address: str = "00:80:E1:22:43:0D",
+        travel_time: float = 2.0,
+        initial_state: RunChickenDoorState = RunChickenDoorState.CLOSED,
+    ) -> None:
+        """Create a door of ``model`` (``T-50`` or ``GIANT``) in ``initial_state``."""
+        protocol = RunChickenProtocol.for_model(model)
+        if protocol is None:
+            msg = f"Unknown model {model}"
+            raise ValueError(msg)
+        self.protocol = protocol
+        self.address = address
+        self.name = "G-90" if model == "GIANT" else "T-80"
+        self.travel_time = travel_time
+        self.door_state = initial_state
+        self.motor_running = False
+        self.battery = 0x50
+        self.services = SimulatedServices(
+            [
+                SimulatedCharacteristic(READ_CHAR_UUID, READ_HANDLE, ("read", "notify")),
+                SimulatedCharacteristic(WRITE_CHAR_UUID, WRITE_HANDLE, ("write",)),
+            ]
+        )
+        #: Human-readable reasons for every frame the door rejected.
+        self.violations: list[str] = []
+        #: Commands that started the motor.
+        self.movements = 0
+        self._hello_received = False
+        self._motion: asyncio.TimerHandle | None = None
+        self._notify: Callable[[bytes], None] | None = None
+
+    def connect(self, notify: Callable[[bytes], None]) -> None:
+        """Start a session; ``notify`` pushes a status frame to the client if it subscribed."""
+        self._hello_received = False
+        self._notify = notify
+
+    def disconnect(self) -> None:
+        """End the session; movement in progress carries on."""
+        self._notify = None
+
+    def status_frame(self, frame_type: int = FRAME_REPLY) -> bytes:
+        """Build the 20-byte status frame for the current state."""
+        frame = bytearray(
+            self.protocol.status_frame.pack(
+                frame_type,
+                int(time.time()),
+                45,
+                -76,
+                self.battery - (8 if self.motor_running else 0),
+                _MOTOR_RUNNING if self.motor_running else 0,
+                _DOOR_STATE_BYTES[self.door_state],
+            )
+        )
+        # Constant bytes the captured frames carry in otherwise unused positions.
+        frame[14] = frame[19] = 0x01
+        return bytes(frame)
+
+    def write(self, frame: bytes) -> None:
+        """Handle a command frame written to the write characteristic."""
+        if len(frame) != self.protocol.frame.size + 1:
+            self._reject(f"frame of {len(frame)} bytes, expected {self.protocol.frame.size + 1}")
+            return
+        if crc8(frame[:-1]) != frame[-1]:
+            self._reject(f"bad CRC {frame[-1]:#04x}, expected {crc8(frame[:-1]):#04x}")
+            return
+        try:
+            action = RunChickenAction(frame[_ACTION_OFFSET])
+        except ValueError:
+            self._reject(f"unknown action {frame[_ACTION_OFFSET]:#04x}")
+            return
+        session = frame[_SESSION_OFFSET] == 0x01
+        if not self._hello_received:
+            if action is not RunChickenAction.STATUS or not session:
+                self._reject(f"{action.name} before the session-init hello")
+                return
+            self._hello_received = True
+        elif session:
+            self._reject("session-init flag set after the hello")
+            return
+        if action is not RunChickenAction.STATUS:
+            self._move(RunChickenDoorState.OPEN if action is RunChickenAction.OPEN else RunChickenDoorState.CLOSED)
+        self._push(FRAME_REPLY)
+
+    def _reject(self, reason: str) -> None:
+        _LOGGER.debug("Simulated door rejected a frame: %s", reason)
+        self.violations.append(reason)
+
+    def _move(self, target: RunChickenDoorState) -> None:
+        """Run the motor towards ``target``; the state flips once it has travelled."""
+        if self.door_state is target and not self.motor_running:
+            return
+        if self._motion is not None:
+            self._motion.cancel()
+        self.movements += 1
+        self.motor_running = True
+        self._motion = asyncio.get_running_loop().call_later(self.travel_time, self._arrive, target)
+
+    def _arrive(self, target: RunChickenDoorState) -> None:
+        self._motion = None
+        self.motor_running = False
+        self.door_state = target
+        self._push(FRAME_PUSH)
+
+    def _push(self, frame_type: int) -> None:
+        if self._notify is not None:
+            self._notify(self.status_frame(frame_type))
+
+
+class SimulatedBleakClient:
+    """A ``BleakClient`` stand-in connected to a ``SimulatedDoor`` over a lossy link."""
+
+    def __init__(
+        self,
+        door: SimulatedDoor,
+        conditions: LinkConditions,
+        disconnected_callback: Callable[[Any], None] | None = None,
+        rng: random.Random | None = None,
+    ) -> None:
+        """Create a client for ``door``; call ``connect`` before use."""
+        self.door = door
+        self.address = door.address
+        self.conditions = conditions
+        self._disconnected_callback = disconnected_callback
+        self._rng = rng or random.Random()  # noqa: S311
+        self._connected = False
+        self._notify_callback: Callable[[Any, bytearray], None] | None = None
+
+    @property
+    def is_connected(self) -> bool:
+        """Return whether the link is up."""
+        return self._connected
+
+    @property
+    def services(self) -> SimulatedServices:
+        """Return the door's GATT services."""
+        return self.door.services
+
+    async def connect(self) -> None:
+        """Establish the link."""
+        await asyncio.sleep(self.conditions.connect_latency)
+        self._connected = True
+        self.door.connect(self._on_door_notify)
+
+    async def disconnect(self) -> None:
+        """Close the link, as asked by the client."""
+        if self._connected:
+            await asyncio.sleep(self._delay())
+            self._drop()
+
+    async def start_notify(self, characteristic: Any, callback: Callable[[Any, bytearray], None]) -> None:  # noqa: ANN401
+        """Subscribe ``callback`` to status-frame notifications."""
+        self._require(characteristic, READ_CHAR_UUID)
+        await self._operation()
+        self._notify_callback = callback
+
+    async def stop_notify(self, characteristic: Any) -> None:  # noqa: ANN401
+        """Unsubscribe from notifications."""
+        self._require(characteristic, READ_CHAR_UUID)
+        await self._operation()
+        self._notify_callback = None
+
+    async def read_gatt_char(self, characteristic: Any) -> bytearray:  # noqa: ANN401
+        """Read the current status frame."""
+        self._require(characteristic, READ_CHAR_UUID)
+        await self._operation()
+        payload = bytearray(self.door.status_frame())
+        self._maybe_drop()
+        return payload
+
+    async def write_gatt_char(self, characteristic: Any, data: bytes, response: bool | None = None) -> None:  # noqa: ANN401, ARG002, FBT001
+        """Write a command frame; a lost write raises ``BleakError`` and drops the link."""
+        self._require(characteristic, WRITE_CHAR_UUID)
+        await self._operation()
+        if self._rng.random() < self.conditions.loss:
+            # The link layer retransmits until the supervision timeout gives up,
+            # so a write that doesn't get through costs the connection too.
+            asyncio.get_running_loop().call_soon(self._drop)
+            msg = "Simulated write timed out"
+            raise BleakError(msg)
+        self.door.write(bytes(data))
+        self._maybe_drop()
+
+    def _require(self, specifier: Any, uuid: str) -> None:  # noqa: ANN401
+        characteristic = self.services.get_characteristic(specifier)
+        if characteristic is None or characteristic.uuid != uuid:
+            msg = f"Characteristic {specifier} is not {uuid}"
+            raise BleakError(msg)
+
+    async def _operation(self) -> None:
+        """Wait out one GATT round trip, failing if the link is (or goes) down."""
+        if not self._connected:
+            msg = "Not connected"
+            raise BleakError(msg)
+        await asyncio.sleep(self._delay())
+        if not self._connected:
+            msg = "Disconnected during operation"
+            raise BleakError(msg)
+
+    def _delay(self) -> float:
+        return self.conditions.latency + self._rng.random() * self.conditions.jitter
+
+    def _maybe_drop(self) -> None:
+        if self._rng.random() < self.conditions.disconnect_rate:
+            _LOGGER.debug("Simulated link to %s dropped", self.address)
+            asyncio.get_running_loop().call_soon(self._drop)
+
+    def _drop(self) -> None:
+        if not self._connected:
+            return
+        self._connected = False
+        self._notify_callback = None
+        self.door.disconnect()
+        if self._disconnected_callback is not None:
+            self._disconnected_callback(self)
+
+    def _on_door_notify(self, payload: bytes) -> None:
+        """Deliver a pushed status frame after the link latency, unless it is lost."""
+        if self._rng.random() < self.conditions.loss:
+            return
+        asyncio.get_running_loop().call_later(self._delay(), self._deliver, payload)
+
+    def _deliver(self, payload: bytes) -> None:
+        if self._connected and self._notify_callback is not None:
+            self._notify_callback(self.services.get_characteristic(READ_HANDLE), bytearray(payload))
+
+
+class SimulatedRunChickenDevice(RunChickenDevice):
+    """A ``RunChickenDevice`` whose connections go to a ``SimulatedDoor``."""
+
+    def __init__(self, door: SimulatedDoor, conditions: LinkConditions | None = None, seed: int | None = None) -> None:
+        """Create the device for ``door``, reached over a link with ``conditions``."""
+        super().__init__(BLEDevice(door.address, door.name, None))
+        self.door = door
+        self.conditions = conditions or LinkConditions()
+        self._rng = random.Random(seed)  # noqa: S311
+
+    async def _async_establish_connection(self, disconnected_callback: Callable[[Any], None]) -> Any:  # noqa: ANN401
+        client = SimulatedBleakClient(self.door, self.conditions, disconnected_callback, self._rng)
+        await client.connect()
+        return client
+
+
+async def run_scenario(args: argparse.Namespace) -> dict[str, Any]:
+    """Toggle a simulated door ``args.commands`` times and collect latency and reconnect stats."""
+    door = SimulatedDoor(args.model, travel_time=args.travel_time)
+    conditions = LinkConditions(
+        latency=args.latency,
+        jitter=args.jitter,
+        connect_latency=args.connect_latency,
+        loss=args.loss,
+        disconnect_rate=args.disconnect_rate,
+    )
+    device = SimulatedRunChickenDevice(door, conditions, args.seed)
+    if args.trace:
+        device.tracer = RunChickenTracer()
+    arrived = asyncio.Event()
+    target = door.door_state
+
+    def on_notify(_sender: Any, payload: bytearray) -> None:  # noqa: ANN401
+        data = device.data_from_bytes(payload)
+        if data.door_state is target and not data.motor_running:
+            arrived.set()
+
+    drops = 0
+
+    def on_disconnect() -> None:
+        nonlocal drops
+        drops += 1
+
+    device.disconnect_callback = on_disconnect
+    await device.register_notification_callback(on_notify)
+
+    write_latencies: list[float] = []
+    arrival_latencies: list[float] = []
+    failed = 0
+    for index in range(args.commands):
+        target = RunChickenDoorState.OPEN if index % 2 == 0 else RunChickenDoorState.CLOSED
+        arrived.clear()
+        started = time.monotonic()
+        try:
+            await (device.async_open() if target is RunChickenDoorState.OPEN else device.async_close())
+        except BleakError:
+            failed += 1
+            continue
+        write_latencies.append(time.monotonic() - started)
+        try:
+            # A lost notification or a drop mid-travel: fall back to a read, as the coordinator does.
+            await asyncio.wait_for(arrived.wait(), door.travel_time + 2)
+        except TimeoutError:
+            try:
+                data = await device.poll_device()
+            except BleakError:
+                data = None
+            if data is None or data.door_state is not target:
+                failed += 1
+                continue
+        arrival_latencies.append(time.monotonic() - started)
+    await device.async_disconnect()
+    if device.tracer is not None:
+        args.trace.write_text(json.dumps(device.tracer.export()))
+
+    stats = device.connection_stats
+    return {
+        "model": args.model,
+        "commands": args.commands,
+        "failed": failed,
+        "write_latency": _describe(write_latencies),
+        "arrival_latency": _describe(arrival_latencies),
+        "connects": stats.connects,
+        "unexpected_disconnects": drops,
+        "mean_connect_latency": stats.total_connect_latency / stats.connects if stats.connects else None,
+        "door_movements": door.movements,
+        "protocol_violations": door.violations,
+    }
+
+
+def _describe(samples: list[float]) -> dict[str, float | None]:
+    if not samples:
+        return {"min": None, "median": None, "max": None}
+    return {"min": min(samples), "median": statistics.median(samples), "max": max(samples)}
+
+
+def main() -> None:
+    """Run a scenario from the command line and print its report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--model", default="T-50", choices=["T-50", "GIANT"])
+    parser.add_argument("--commands", type=int, default=10)
+    parser.add_argument("--travel-time", type=float, default=1.0)
+    parser.add_argument("--latency", type=float, default=0.03)
+    parser.add_argument("--jitter", type=float, default=0.02)
+    parser.add_argument("--connect-latency", type=float, default=0.5)
+    parser.add_argument("--loss", type=float, default=0.0)
+    parser.add_argument("--disconnect-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--trace", type=pathlib.Path, help="write a Chrome trace of every BLE phase to this file")
+    parser.add_argument("-v", "--verbose", action="store_true")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.WARNING)
+
+    report = asyncio.run(run_scenario(args))
+    for key, value in report.items():
+        print(f"  {key}: {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,12 @@
 import asyncio
+import sys
+from pathlib import Path
+
+# Imported standalone: through the ``run_chicken`` package it would load Home Assistant.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "custom_components" / "run_chicken"))
 
 from bleak import BleakClient
-from run_chicken.run_chicken_ble.protocol import T50Protocol
+from run_chicken_ble.protocol import T50Protocol
 
 SERVICE_UUID = "00000000-cc7a-482a-984a-7f2ed5b3e58f"
 ADDR = "00:80:e1:22:43:0d"
@@ -11,7 +16,7 @@ CHARACTERISTIC_UUID = "00000000-8e22-4541-9d4c-21edae82ed19"
 async def main() -> None:  # noqa: FBT001 FBT002
     """Test writing to the Run-Chicken BLE device."""
     async with BleakClient(ADDR) as client:
-        packet = T50Protocol().create_close_packet()
+        packet = T50Protocol().close_packet()
         await client.write_gatt_char(CHARACTERISTIC_UUID, packet)
         await asyncio.sleep(10)
 
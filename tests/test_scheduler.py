@@ -0,0 +1,168 @@
+"""Tests for the notification coalescer and the adaptive poll interval."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
+
+from custom_components.run_chicken.const import (
+    DEFAULT_SCAN_INTERVAL,
+    MAX_SCAN_INTERVAL,
+    MIN_SCAN_INTERVAL,
+    PUSH_HEALTHY_WINDOW,
+)
+from custom_components.run_chicken.scheduler import AdaptivePollInterval, NotificationCoalescer
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+WINDOW = 5.0
+
+
+class FakeLoop:
+    """Just enough of an event loop for ``call_later``, driven by ``advance``."""
+
+    def __init__(self) -> None:
+        """Start the clock at zero with no timers."""
+        self.now = 0.0
+        self._timers: list[FakeTimer] = []
+
+    def call_later(self, delay: float, callback: Callable[[], None]) -> FakeTimer:
+        """Schedule ``callback`` ``delay`` seconds from now."""
+        timer = FakeTimer(self.now + delay, callback)
+        self._timers.append(timer)
+        return timer
+
+    def advance(self, seconds: float) -> None:
+        """Move the clock on and run every timer that came due."""
+        self.now += seconds
+        due = [timer for timer in self._timers if timer.when <= self.now and not timer.cancelled]
+        self._timers = [timer for timer in self._timers if timer not in due]
+        for timer in due:
+            timer.callback()
+
+
+class FakeTimer:
+    """A cancellable timer handle."""
+
+    def __init__(self, when: float, callback: Callable[[], None]) -> None:
+        """Run ``callback`` at loop time ``when``."""
+        self.when = when
+        self.callback = callback
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        """Stop the timer from firing."""
+        self.cancelled = True
+
+
+class Listeners:
+    """The state the coordinator holds, moved on by publishes and (in tests) polls."""
+
+    def __init__(self) -> None:
+        """Start with no state."""
+        self.state: object | None = None
+        self.published: list[object] = []
+
+    def publish(self, update: object) -> None:
+        """Take ``update`` as the new state, the way the coordinator does."""
+        self.state = update
+        self.published.append(update)
+
+
+def _coalescer() -> tuple[NotificationCoalescer[object], Listeners, FakeLoop]:
+    """Return a coalescer publishing into fresh listeners on a fake loop."""
+    loop = FakeLoop()
+    listeners = Listeners()
+    hass: Any = SimpleNamespace(loop=loop)
+    coalescer = NotificationCoalescer(hass, listeners.publish, lambda: listeners.state, WINDOW)
+    return coalescer, listeners, loop
+
+
+def test_repeats_are_coalesced() -> None:
+    """Repeats within a window go out once, when it closes."""
+    coalescer, listeners, loop = _coalescer()
+    state_a = object()
+
+    for _ in range(3):
+        coalescer.async_submit(state_a)
+    assert listeners.published == [state_a]
+
+    loop.advance(WINDOW)
+    assert listeners.published == [state_a, state_a]
+    assert coalescer.stats.merged == 1
+
+
+def test_change_is_published_at_once() -> None:
+    """A change supersedes a held repeat and goes out immediately."""
+    coalescer, listeners, _loop = _coalescer()
+    state_a, state_b = object(), object()
+
+    coalescer.async_submit(state_a)
+    coalescer.async_submit(state_a)
+    coalescer.async_submit(state_b)
+    assert listeners.published == [state_a, state_b]
+
+
+def test_change_after_a_poll_is_published_at_once() -> None:
+    """A notification is compared with the state a poll left, not with the last publish."""
+    coalescer, listeners, loop = _coalescer()
+    state_a, state_b = object(), object()
+
+    coalescer.async_submit(state_a)
+    # A poll moves the state on without going through the coalescer.
+    listeners.state = state_b
+    loop.advance(WINDOW / 2)
+    # A notification of A is now a change, and must not wait for the window.
+    coalescer.async_submit(state_a)
+    assert listeners.published == [state_a, state_a]
+    assert listeners.state is state_a
+
+
+def test_held_repeat_is_dropped_once_a_poll_moved_on() -> None:
+    """A repeat held past a poll that changed the state isn't published over it."""
+    coalescer, listeners, loop = _coalescer()
+    state_a, state_b = object(), object()
+
+    coalescer.async_submit(state_a)
+    coalescer.async_submit(state_a)
+    listeners.state = state_b
+    loop.advance(WINDOW)
+    # Publishing the held A would roll the poll's newer state back.
+    assert listeners.published == [state_a]
+    assert listeners.state is state_b
+    assert coalescer.stats.merged == 1
+
+
+def _poll_interval() -> AdaptivePollInterval:
+    """Return a poll interval with the integration's default bounds."""
+    return AdaptivePollInterval(DEFAULT_SCAN_INTERVAL, MIN_SCAN_INTERVAL, MAX_SCAN_INTERVAL, PUSH_HEALTHY_WINDOW)
+
+
+def test_poll_interval_stretches_only_while_notifications_are_recent() -> None:
+    """The hello reply of a reconnect carries polling one step out, not toward the maximum."""
+    interval = _poll_interval()
+
+    interval.async_note_reconnect()
+    # The hello reply arrived during the reconnect's poll.
+    assert interval.next_interval(connected=True, notification_age=1) == MIN_SCAN_INTERVAL
+    assert interval.next_interval(connected=True, notification_age=MIN_SCAN_INTERVAL + 1) == 2 * DEFAULT_SCAN_INTERVAL
+    # Nothing since: the subscription may be dead, so back to the base interval.
+    age = MIN_SCAN_INTERVAL + 2 * DEFAULT_SCAN_INTERVAL + 1
+    assert interval.next_interval(connected=True, notification_age=age) == DEFAULT_SCAN_INTERVAL
+    assert interval.next_interval(connected=True, notification_age=age + DEFAULT_SCAN_INTERVAL) == DEFAULT_SCAN_INTERVAL
+
+
+def test_poll_interval_stretches_to_the_maximum_while_pushed() -> None:
+    """Steady notifications double the interval up to the maximum."""
+    interval = _poll_interval()
+
+    seconds = [interval.next_interval(connected=True, notification_age=10) for _ in range(5)]
+    assert seconds == [
+        2 * DEFAULT_SCAN_INTERVAL,
+        4 * DEFAULT_SCAN_INTERVAL,
+        8 * DEFAULT_SCAN_INTERVAL,
+        MAX_SCAN_INTERVAL,
+        MAX_SCAN_INTERVAL,
+    ]
+    assert interval.next_interval(connected=False, notification_age=10) == DEFAULT_SCAN_INTERVAL